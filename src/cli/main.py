@@ -2,10 +2,12 @@
 
 import argparse
 import sys
-from datetime import UTC, date, datetime
+from datetime import date
+from typing import TYPE_CHECKING
 
-from src.models.config import AppConfig, ReportPeriod
-from src.services.report_generator import ReportGenerator
+
+if TYPE_CHECKING:
+    from src.services.report_generator import ReportGenerator
 
 
 def parse_date(value: str) -> date:
@@ -21,7 +23,7 @@ def parse_date(value: str) -> date:
         argparse.ArgumentTypeError: If date format is invalid.
     """
     try:
-        return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=UTC).date()
+        return date.fromisoformat(value)
     except ValueError as err:
         msg = f"Invalid date format: {value}. Expected YYYY-MM-DD."
         raise argparse.ArgumentTypeError(msg) from err
@@ -94,6 +96,12 @@ def create_parser() -> argparse.ArgumentParser:
         help="Override email recipients",
     )
 
+    parser.add_argument(
+        "--precompile-templates",
+        action="store_true",
+        help="Compile report templates into an importable archive and exit",
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -116,7 +124,7 @@ def build_config_overrides(args: argparse.Namespace) -> dict:
     overrides: dict = {}
 
     if args.period:
-        overrides["report_period"] = ReportPeriod(args.period)
+        overrides["report_period"] = args.period
 
     if args.api_url:
         overrides["bt_servant_api_url"] = args.api_url
@@ -130,6 +138,28 @@ def build_config_overrides(args: argparse.Namespace) -> dict:
     return overrides
 
 
+def run_without_pdf(
+    generator: "ReportGenerator",
+    start_date: date | None,
+    end_date: date | None,
+) -> None:
+    """Fetch and process logs without rendering a PDF (test mode).
+
+    Args:
+        generator: Report generator to drive.
+        start_date: Optional explicit start date.
+        end_date: Optional explicit end date.
+    """
+    start_date, end_date = generator.resolve_dates(start_date, end_date)
+    print(f"Date range: {start_date} to {end_date}")
+    print("Fetching and processing logs...")
+    log_lines = generator.fetch_logs(start_date, end_date)
+    report_data = generator.process_logs(log_lines, start_date, end_date)
+    print(f"Processed {report_data.executive_summary.total_interactions} interactions")
+    print(f"Total cost: ${report_data.executive_summary.total_cost_usd:.4f}")
+    print("Test complete (PDF generation skipped)")
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for CLI.
 
@@ -145,40 +175,39 @@ def main(argv: list[str] | None = None) -> int:
     if args.period == "custom" and (args.start_date is None or args.end_date is None):
         parser.error("--start-date and --end-date required for custom period")
 
+    # Deferred so --help and argument errors don't pay for pydantic/httpx/jinja2 imports.
+    from src.models.config import get_config
+    from src.services.pdf_generator import PdfGenerator
+    from src.services.report_generator import ReportGenerator
+
     try:
+        if args.precompile_templates:
+            print(f"Templates compiled to: {PdfGenerator().precompile_templates()}")
+            return 0
+
         overrides = build_config_overrides(args)
-        config = AppConfig(**overrides)
+        send_email = not (args.no_email or args.skip_pdf)
+        config = get_config(include_email=send_email, **overrides)
 
         if args.verbose:
             print(f"API URL: {config.bt_servant_api_url}")
             print(f"Report period: {config.report_period.value}")
             print(f"Output directory: {config.report_output_dir}")
 
-        generator = ReportGenerator(config)
+        generator = ReportGenerator(config, send_email=send_email)
 
         if args.skip_pdf:
-            # Test mode: just fetch and process logs
-            start_date, end_date = generator.resolve_dates(args.start_date, args.end_date)
-            print(f"Date range: {start_date} to {end_date}")
-            print("Fetching logs...")
-            log_content = generator.fetch_logs(start_date, end_date)
-            print(f"Fetched {len(log_content)} bytes of log data")
-            print("Processing logs...")
-            report_data = generator.process_logs(log_content, start_date, end_date)
-            print(f"Processed {report_data.executive_summary.total_interactions} interactions")
-            print(f"Total cost: ${report_data.executive_summary.total_cost_usd:.4f}")
-            print("Test complete (PDF generation skipped)")
+            run_without_pdf(generator, args.start_date, args.end_date)
             return 0
 
-        pdf_path = generator.generate_and_send(
+        result = generator.generate_and_send(
             start_date=args.start_date,
             end_date=args.end_date,
-            send_email=not args.no_email,
         )
 
-        print(f"Report generated: {pdf_path}")
-        if not args.no_email:
-            print(f"Email sent to: {', '.join(config.email_to)}")
+        print(f"Report generated: {result.pdf_path}")
+        if result.email_sent:
+            print(f"Email sent to: {', '.join(result.emailed_to)}")
 
         return 0
 
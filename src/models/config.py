@@ -24,8 +24,8 @@ class ReportPeriod(str, Enum):
     CUSTOM = "custom"
 
 
-class AppConfig(BaseSettings):
-    """Application configuration loaded from environment variables."""
+class ApiConfig(BaseSettings):
+    """Configuration needed to fetch logs and build a report."""
 
     model_config: ClassVar[Any] = {
         "env_file": ".env",
@@ -42,25 +42,9 @@ class AppConfig(BaseSettings):
     report_start_date: date | None = Field(default=None)
     report_end_date: date | None = Field(default=None)
 
-    # SMTP Configuration
-    smtp_host: str = Field(default="smtp.gmail.com")
-    smtp_port: int = Field(default=587)
-    smtp_user: str = Field(description="SMTP username")
-    smtp_password: SecretStr = Field(description="SMTP password")
-    email_from: EmailStr = Field(description="Sender email address")
-    email_to: list[EmailStr] = Field(description="Recipient email addresses")
-
     # Output
     report_output_dir: Path = Field(default=Path("./reports"))
 
-    @field_validator("email_to", mode="before")
-    @classmethod
-    def _parse_email_to(cls, value: object) -> object:
-        """Allow comma- or semicolon-delimited strings for email_to."""
-        if isinstance(value, str):
-            return [part.strip() for part in value.replace(";", ",").split(",") if part.strip()]
-        return value
-
     @classmethod
     # pylint: disable=too-many-positional-arguments
     def settings_customise_sources(
@@ -94,3 +78,38 @@ class AppConfig(BaseSettings):
             LenientDotEnvSettingsSource(settings_cls, getattr(dotenv_settings, "env_file", None)),
             file_secret_settings,
         )
+
+
+class AppConfig(ApiConfig):
+    """Application configuration including SMTP settings for email delivery."""
+
+    # SMTP Configuration
+    smtp_host: str = Field(default="smtp.gmail.com")
+    smtp_port: int = Field(default=587)
+    smtp_user: str = Field(description="SMTP username")
+    smtp_password: SecretStr = Field(description="SMTP password")
+    email_from: EmailStr = Field(description="Sender email address")
+    email_to: list[EmailStr] = Field(description="Recipient email addresses")
+
+    @field_validator("email_to", mode="before")
+    @classmethod
+    def _parse_email_to(cls, value: object) -> object:
+        """Allow comma- or semicolon-delimited strings for email_to."""
+        if isinstance(value, str):
+            return [part.strip() for part in value.replace(";", ",").split(",") if part.strip()]
+        return value
+
+
+def get_config(*, include_email: bool = True, **overrides: Any) -> ApiConfig:
+    """Build the config from the environment, .env, and the given overrides.
+
+    Args:
+        include_email: Build a full AppConfig with SMTP settings. When False,
+            only ApiConfig is built and SMTP/email variables are not required.
+        **overrides: Field values that take precedence over the environment.
+
+    Returns:
+        An AppConfig, or ApiConfig when include_email is False.
+    """
+    config_cls = AppConfig if include_email else ApiConfig
+    return config_cls(**overrides)
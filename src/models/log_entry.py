@@ -2,7 +2,17 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+
+def _parse_iso_datetime(value: object) -> object:
+    """Parse ISO-8601 strings with datetime.fromisoformat, deferring others to pydantic."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return value
 
 
 class LogEntry(BaseModel):
@@ -18,6 +28,12 @@ class LogEntry(BaseModel):
     user: str
     schema_version: str
 
+    @field_validator("timestamp", mode="before")
+    @classmethod
+    def _parse_timestamp(cls, value: object) -> object:
+        """Use the C-level ISO parser for the common log timestamp shape."""
+        return _parse_iso_datetime(value)
+
 
 class LogFileEntry(BaseModel):
     """Metadata for a log file from the API."""
@@ -27,6 +43,12 @@ class LogFileEntry(BaseModel):
     modified_at: datetime
     created_at: datetime
 
+    @field_validator("modified_at", "created_at", mode="before")
+    @classmethod
+    def _parse_file_times(cls, value: object) -> object:
+        """Use the C-level ISO parser for API file timestamps."""
+        return _parse_iso_datetime(value)
+
 
 class LogFilesPayload(BaseModel):
     """Response from the log files API endpoint."""
@@ -2,12 +2,14 @@
 
 from decimal import Decimal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Span(BaseModel):
     """A processing span within a PerfReport."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     duration_ms: Decimal
     duration_se: Decimal
@@ -25,6 +27,8 @@ class Span(BaseModel):
 class IntentTotals(BaseModel):
     """Token and cost totals for a specific intent."""
 
+    model_config = ConfigDict(frozen=True)
+
     input_tokens: int
     output_tokens: int
     total_tokens: int
@@ -44,6 +48,8 @@ class IntentTotals(BaseModel):
 class PerfReport(BaseModel):
     """Performance report for a single user interaction."""
 
+    model_config = ConfigDict(frozen=True)
+
     user_id: str
     trace_id: str
     total_ms: Decimal
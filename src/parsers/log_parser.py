@@ -1,63 +1,153 @@
 """Log parsing utilities for bt-servant logs."""
 
-import json
 import re
-from collections.abc import Iterator
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 
 from src.models.log_entry import LogEntry
 from src.models.perf_report import PerfReport
 
 
 PERF_REPORT_PREFIX = "PerfReport "
+PERF_REPORT_PREFIX_LEN = len(PERF_REPORT_PREFIX)
+_PERF_REPORT_OBJECT_PREFIX = PERF_REPORT_PREFIX + "{"
+INTENT_MARKER = "extracted user intents: "
+LANGUAGE_MARKER = "language code "
+INTENT_PATTERN = re.compile(INTENT_MARKER + r"(.+)")
+LANGUAGE_PATTERN = re.compile(LANGUAGE_MARKER + r"(\w+) detected")
 
 
-def parse_log_lines(content: str) -> Iterator[LogEntry]:
+def iter_lines(content: str) -> Iterator[str]:
+    """Yield newline-delimited lines from a string one at a time.
+
+    Unlike str.splitlines(), this does not build a list holding a second copy
+    of the whole content, and it only splits on "\\n".
+
+    Args:
+        content: Raw text content.
+
+    Yields:
+        Each line without its trailing newline.
+    """
+    start = 0
+    length = len(content)
+    while start < length:
+        end = content.find("\n", start)
+        if end == -1:
+            end = length
+        yield content[start:end]
+        start = end + 1
+
+
+def parse_log_lines(content: str | Iterable[str]) -> Iterator[LogEntry]:
     """Parse JSON lines format into LogEntry objects.
 
+    Lines that do not start with "{" cannot be log objects and are skipped
+    without invoking the JSON parser. The rest are decoded and validated in a
+    single pydantic-core call, without building an intermediate dict.
+
     Args:
-        content: Raw log file content with one JSON object per line.
+        content: Raw log file content with one JSON object per line, or an
+            iterable of already-split lines (e.g. a streamed HTTP response).
 
     Yields:
         LogEntry objects for each valid log line.
     """
-    for raw_line in content.splitlines():
+    lines = iter_lines(content) if isinstance(content, str) else content
+    for raw_line in lines:
         line = raw_line.strip()
-        if not line:
+        if not line or line[0] != "{":
             continue
         try:
-            data = json.loads(line)
-            yield LogEntry.model_validate(data)
-        except (json.JSONDecodeError, ValueError):
+            yield LogEntry.model_validate_json(line)
+        except ValueError:
             continue
 
 
-def extract_perf_reports(log_entries: Iterator[LogEntry]) -> list[PerfReport]:
-    """Extract PerfReport entries from log messages.
+def extract_perf_report(entry: LogEntry) -> PerfReport | None:
+    """Extract the PerfReport embedded in a single log entry, if any.
 
     PerfReport entries are JSON objects embedded in the message field,
-    prefixed with "PerfReport ".
+    prefixed with "PerfReport ". A single prefix check covers both the
+    marker and the opening brace of the payload, which is then decoded and
+    validated in one pydantic-core call.
 
     Args:
-        log_entries: Iterator of LogEntry objects.
+        entry: LogEntry to inspect.
+
+    Returns:
+        The parsed PerfReport, or None if the entry does not carry a valid one.
+    """
+    if not entry.message.startswith(_PERF_REPORT_OBJECT_PREFIX):
+        return None
+
+    try:
+        return PerfReport.model_validate_json(entry.message[PERF_REPORT_PREFIX_LEN:])
+    except ValueError:
+        return None
+
+
+def extract_perf_reports(log_entries: Iterable[LogEntry]) -> list[PerfReport]:
+    """Extract PerfReport entries from log messages.
+
+    Args:
+        log_entries: Iterable of LogEntry objects.
 
     Returns:
         List of PerfReport objects extracted from the logs.
     """
-    perf_reports: list[PerfReport] = []
+    return [
+        perf_report
+        for entry in log_entries
+        if (perf_report := extract_perf_report(entry)) is not None
+    ]
 
-    for entry in log_entries:
-        if not entry.message.startswith(PERF_REPORT_PREFIX):
-            continue
 
-        json_str = entry.message[len(PERF_REPORT_PREFIX) :]
-        try:
-            data = json.loads(json_str)
-            perf_report = PerfReport.model_validate(data)
-            perf_reports.append(perf_report)
-        except (json.JSONDecodeError, ValueError):
-            continue
+def parse_intents(message: str) -> list[str]:
+    """Return the intents listed in a single log message.
 
-    return perf_reports
+    Args:
+        message: Log message text.
+
+    Returns:
+        Intent names in the order listed, or an empty list if the message
+        does not report extracted intents.
+    """
+    # Most messages carry neither marker; a substring test rules them out
+    # far faster than a regex search.
+    if INTENT_MARKER not in message:
+        return []
+    match = INTENT_PATTERN.search(message)
+    if match is None:
+        return []
+    return [intent.strip() for intent in match.group(1).split(", ")]
+
+
+def parse_language(message: str) -> str | None:
+    """Return the language code detected in a single log message.
+
+    Args:
+        message: Log message text.
+
+    Returns:
+        The detected language code, or None if the message reports none.
+    """
+    if LANGUAGE_MARKER not in message:
+        return None
+    match = LANGUAGE_PATTERN.search(message)
+    return match.group(1) if match else None
+
+
+def is_real_user(user: str) -> bool:
+    """Check whether a log entry's user field names an actual user.
+
+    Args:
+        user: User field of a log entry.
+
+    Returns:
+        False for the "-" placeholder and empty values, True otherwise.
+    """
+    return bool(user) and user != "-"
 
 
 def extract_intents(log_entries: list[LogEntry]) -> list[str]:
@@ -70,14 +160,9 @@ def extract_intents(log_entries: list[LogEntry]) -> list[str]:
         List of intent names detected in the logs.
     """
     intents: list[str] = []
-    pattern = re.compile(r"extracted user intents: (.+)")
 
     for entry in log_entries:
-        match = pattern.search(entry.message)
-        if match:
-            intent_str = match.group(1)
-            for intent in intent_str.split(", "):
-                intents.append(intent.strip())
+        intents.extend(parse_intents(entry.message))
 
     return intents
 
@@ -91,16 +176,27 @@ def extract_languages(log_entries: list[LogEntry]) -> dict[str, int]:
     Returns:
         Dictionary mapping language codes to occurrence counts.
     """
-    languages: dict[str, int] = {}
-    pattern = re.compile(r"language code (\w+) detected")
+    languages: defaultdict[str, int] = defaultdict(int)
 
     for entry in log_entries:
-        match = pattern.search(entry.message)
-        if match:
-            lang_code = match.group(1)
-            languages[lang_code] = languages.get(lang_code, 0) + 1
+        language = parse_language(entry.message)
+        if language is not None:
+            languages[language] += 1
+
+    return dict(languages)
+
 
-    return languages
+def _unique_messages(log_entries: list[LogEntry], level: str) -> list[str]:
+    """Collect the distinct messages logged at one level, in first-seen order.
+
+    Args:
+        log_entries: List of LogEntry objects.
+        level: Log level to keep.
+
+    Returns:
+        List of unique messages.
+    """
+    return list(dict.fromkeys(entry.message for entry in log_entries if entry.level == level))
 
 
 def extract_warnings(log_entries: list[LogEntry]) -> list[str]:
@@ -112,13 +208,7 @@ def extract_warnings(log_entries: list[LogEntry]) -> list[str]:
     Returns:
         List of unique warning messages.
     """
-    warnings: list[str] = []
-
-    for entry in log_entries:
-        if entry.level == "WARNING" and entry.message not in warnings:
-            warnings.append(entry.message)
-
-    return warnings
+    return _unique_messages(log_entries, "WARNING")
 
 
 def extract_errors(log_entries: list[LogEntry]) -> list[str]:
@@ -130,37 +220,31 @@ def extract_errors(log_entries: list[LogEntry]) -> list[str]:
     Returns:
         List of unique error messages.
     """
-    errors: list[str] = []
-
-    for entry in log_entries:
-        if entry.level == "ERROR" and entry.message not in errors:
-            errors.append(entry.message)
+    return _unique_messages(log_entries, "ERROR")
 
-    return errors
 
-
-def count_by_level(log_entries: list[LogEntry]) -> dict[str, int]:
+def count_by_level(log_entries: Iterable[LogEntry]) -> dict[str, int]:
     """Count log entries by level.
 
     Args:
-        log_entries: List of LogEntry objects.
+        log_entries: LogEntry objects, consumed once.
 
     Returns:
         Dictionary mapping log levels to counts.
     """
-    counts: dict[str, int] = {}
+    counts: defaultdict[str, int] = defaultdict(int)
 
     for entry in log_entries:
-        counts[entry.level] = counts.get(entry.level, 0) + 1
+        counts[entry.level] += 1
 
-    return counts
+    return dict(counts)
 
 
-def extract_unique_users(log_entries: list[LogEntry]) -> set[str]:
+def extract_unique_users(log_entries: Iterable[LogEntry]) -> set[str]:
     """Extract unique user IDs from logs.
 
     Args:
-        log_entries: List of LogEntry objects.
+        log_entries: LogEntry objects, consumed once.
 
     Returns:
         Set of unique user IDs (excluding "-" placeholder).
@@ -168,7 +252,7 @@ def extract_unique_users(log_entries: list[LogEntry]) -> set[str]:
     users: set[str] = set()
 
     for entry in log_entries:
-        if entry.user and entry.user != "-":
+        if is_real_user(entry.user):
             users.add(entry.user)
 
     return users
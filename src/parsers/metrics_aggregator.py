@@ -1,8 +1,15 @@
 """Metrics aggregation for report generation."""
 
-from collections import Counter
+import heapq
+import math
+import statistics
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 from decimal import Decimal
+from itertools import islice
+from operator import itemgetter
 
 from src.models.log_entry import LogEntry
 from src.models.perf_report import PerfReport
@@ -16,26 +23,231 @@ from src.models.report_data import (
     UsageAnalytics,
 )
 from src.parsers.log_parser import (
-    count_by_level,
-    extract_errors,
-    extract_intents,
-    extract_languages,
-    extract_unique_users,
-    extract_warnings,
+    extract_perf_report,
+    is_real_user,
+    parse_intents,
+    parse_language,
 )
 
 
+COST_QUANTUM = Decimal("0.000001")
+DURATION_QUANTUM = Decimal("0.01")
+PERCENT_QUANTUM = Decimal("0.01")
+ZERO = Decimal("0")
+HUNDRED = Decimal("100")
+
+
+@dataclass
+class PerfTotals:
+    """Running totals collected from PerfReports in a single pass."""
+
+    input_cost: float = 0.0
+    output_cost: float = 0.0
+    cached_cost: float = 0.0
+    audio_cost: float = 0.0
+    total_cost: float = 0.0
+    response_times: list[float] = field(default_factory=list)
+    intent_costs: defaultdict[str, float] = field(default_factory=lambda: defaultdict(float))
+    intent_counts: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+    span_totals: defaultdict[str, float] = field(default_factory=lambda: defaultdict(float))
+    span_counts: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def interactions(self) -> int:
+        """Number of PerfReports seen."""
+        return len(self.response_times)
+
+    @property
+    def total_ms(self) -> float:
+        """Sum of all response times in milliseconds."""
+        return math.fsum(self.response_times)
+
+    def add(self, report: PerfReport) -> None:
+        """Fold one PerfReport into the running totals.
+
+        Args:
+            report: PerfReport to accumulate.
+        """
+        self.input_cost += float(report.total_input_cost_usd)
+        self.output_cost += float(report.total_output_cost_usd)
+        self.cached_cost += float(report.total_cached_input_cost_usd)
+        self.audio_cost += float(report.total_audio_input_cost_usd)
+        self.audio_cost += float(report.total_audio_output_cost_usd)
+        self.total_cost += float(report.total_cost_usd)
+
+        self.response_times.append(float(report.total_ms))
+
+        intent_costs = self.intent_costs
+        intent_counts = self.intent_counts
+        for intent_name, intent_totals in report.grouped_totals_by_intent.items():
+            intent_costs[intent_name] += float(intent_totals.total_cost_usd)
+            intent_counts[intent_name] += 1
+
+        span_totals = self.span_totals
+        span_counts = self.span_counts
+        for span in report.spans:
+            name = span.name
+            span_totals[name] += float(span.duration_ms)
+            span_counts[name] += 1
+
+
+@dataclass
+class LogTotals:
+    """Running totals collected from log entries in a single pass."""
+
+    level_counts: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+    users: set[str] = field(default_factory=set)
+    intent_counts: Counter[str] = field(default_factory=Counter)
+    languages: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+    warnings: dict[str, None] = field(default_factory=dict)
+    errors: dict[str, None] = field(default_factory=dict)
+
+    def add(self, entry: LogEntry) -> None:
+        """Fold one log entry into the running totals.
+
+        Warnings and errors are kept as insertion-ordered dict keys so that
+        repeated messages are deduplicated without a separate seen-set.
+
+        Args:
+            entry: LogEntry to accumulate.
+        """
+        self.level_counts[entry.level] += 1
+
+        if is_real_user(entry.user):
+            self.users.add(entry.user)
+
+        if entry.level == "WARNING":
+            self.warnings[entry.message] = None
+        elif entry.level == "ERROR":
+            self.errors[entry.message] = None
+
+        self.intent_counts.update(parse_intents(entry.message))
+
+        language = parse_language(entry.message)
+        if language is not None:
+            self.languages[language] += 1
+
+
+def _to_decimal(value: float, quantum: Decimal) -> Decimal:
+    """Convert a float accumulator back to a Decimal at the given precision.
+
+    Args:
+        value: Accumulated float value.
+        quantum: Decimal exponent to quantize to.
+
+    Returns:
+        Decimal rounded to the quantum.
+    """
+    return Decimal(str(value)).quantize(quantum)
+
+
+def _percentile_index(count: int, percentile: int) -> int:
+    """Return the nearest-rank index of a percentile in a sorted sequence.
+
+    Args:
+        count: Length of the sorted sequence, at least 1.
+        percentile: Percentile to locate (0-100).
+
+    Returns:
+        Index of the value at the given percentile.
+    """
+    return (count - 1) * percentile // 100
+
+
+def aggregate_perf(perf_reports: Iterable[PerfReport]) -> PerfTotals:
+    """Collect every PerfReport-derived total in one pass.
+
+    Args:
+        perf_reports: PerfReport objects, consumed once.
+
+    Returns:
+        PerfTotals with cost, timing, intent, and span accumulators.
+    """
+    totals = PerfTotals()
+    for report in perf_reports:
+        totals.add(report)
+    return totals
+
+
+def aggregate_logs(log_entries: Iterable[LogEntry]) -> LogTotals:
+    """Collect every log-entry-derived total in one pass.
+
+    Args:
+        log_entries: LogEntry objects, consumed once.
+
+    Returns:
+        LogTotals with level counts, users, intents, languages, and messages.
+    """
+    totals = LogTotals()
+    for entry in log_entries:
+        totals.add(entry)
+    return totals
+
+
 def aggregate_metrics(
-    perf_reports: list[PerfReport],
-    log_entries: list[LogEntry],
+    perf_reports: Iterable[PerfReport],
+    log_entries: Iterable[LogEntry],
     start_date: date,
     end_date: date,
 ) -> ReportData:
     """Aggregate all metrics into final report data structure.
 
     Args:
-        perf_reports: List of PerfReport objects from logs.
-        log_entries: List of LogEntry objects from logs.
+        perf_reports: PerfReport objects from logs.
+        log_entries: LogEntry objects from logs.
+        start_date: Start date of the report period.
+        end_date: End date of the report period.
+
+    Returns:
+        Complete ReportData with all sections populated.
+    """
+    return build_report_data(
+        aggregate_perf(perf_reports), aggregate_logs(log_entries), start_date, end_date
+    )
+
+
+def aggregate_log_stream(
+    log_entries: Iterable[LogEntry],
+    start_date: date,
+    end_date: date,
+) -> ReportData:
+    """Aggregate a stream of log entries into report data in a single pass.
+
+    PerfReports are extracted from each entry as it goes by, so neither the
+    entries nor the reports are ever held in a list; peak memory follows the
+    size of the running totals rather than the number of log lines.
+
+    Args:
+        log_entries: LogEntry objects, typically a lazy generator.
+        start_date: Start date of the report period.
+        end_date: End date of the report period.
+
+    Returns:
+        Complete ReportData with all sections populated.
+    """
+    perf_totals = PerfTotals()
+    log_totals = LogTotals()
+
+    for entry in log_entries:
+        log_totals.add(entry)
+        perf_report = extract_perf_report(entry)
+        if perf_report is not None:
+            perf_totals.add(perf_report)
+
+    return build_report_data(perf_totals, log_totals, start_date, end_date)
+
+
+def build_report_data(
+    perf_totals: PerfTotals,
+    log_totals: LogTotals,
+    start_date: date,
+    end_date: date,
+) -> ReportData:
+    """Build the full report from pre-aggregated totals.
+
+    Args:
+        perf_totals: Totals collected from PerfReports.
+        log_totals: Totals collected from log entries.
         start_date: Start date of the report period.
         end_date: End date of the report period.
 
@@ -44,14 +256,12 @@ def aggregate_metrics(
     """
     return ReportData(
         generated_at=datetime.now(UTC),
-        executive_summary=calculate_executive_summary(
-            perf_reports, log_entries, start_date, end_date
-        ),
-        cost_breakdown=calculate_cost_breakdown(perf_reports),
-        cost_by_intent=calculate_cost_by_intent(perf_reports),
-        performance=calculate_performance_metrics(perf_reports),
-        usage=calculate_usage_analytics(log_entries),
-        system_health=calculate_system_health(log_entries),
+        executive_summary=build_executive_summary(perf_totals, log_totals, start_date, end_date),
+        cost_breakdown=build_cost_breakdown(perf_totals),
+        cost_by_intent=build_cost_by_intent(perf_totals),
+        performance=build_performance_metrics(perf_totals),
+        usage=build_usage_analytics(log_totals),
+        system_health=build_system_health(log_totals),
     )
 
 
@@ -72,22 +282,39 @@ def calculate_executive_summary(
     Returns:
         ExecutiveSummary with aggregated metrics.
     """
-    total_interactions = len(perf_reports)
-    total_cost = sum((r.total_cost_usd for r in perf_reports), Decimal("0"))
-    unique_users = extract_unique_users(log_entries)
+    return build_executive_summary(
+        aggregate_perf(perf_reports), aggregate_logs(log_entries), start_date, end_date
+    )
 
-    avg_response_time = Decimal("0")
-    if total_interactions > 0:
-        total_time = sum((r.total_ms for r in perf_reports), Decimal("0"))
-        avg_response_time = total_time / total_interactions
+
+def build_executive_summary(
+    perf_totals: PerfTotals,
+    log_totals: LogTotals,
+    start_date: date,
+    end_date: date,
+) -> ExecutiveSummary:
+    """Build executive summary metrics from pre-aggregated totals.
+
+    Args:
+        perf_totals: Totals collected by aggregate_perf.
+        log_totals: Totals collected by aggregate_logs.
+        start_date: Report period start date.
+        end_date: Report period end date.
+
+    Returns:
+        ExecutiveSummary with aggregated metrics.
+    """
+    avg_response_time = 0.0
+    if perf_totals.interactions > 0:
+        avg_response_time = perf_totals.total_ms / perf_totals.interactions
 
     return ExecutiveSummary(
         date_range_start=start_date,
         date_range_end=end_date,
-        total_interactions=total_interactions,
-        total_cost_usd=total_cost,
-        avg_response_time_ms=avg_response_time,
-        unique_users=len(unique_users),
+        total_interactions=perf_totals.interactions,
+        total_cost_usd=_to_decimal(perf_totals.total_cost, COST_QUANTUM),
+        avg_response_time_ms=_to_decimal(avg_response_time, DURATION_QUANTUM),
+        unique_users=len(log_totals.users),
     )
 
 
@@ -100,20 +327,24 @@ def calculate_cost_breakdown(perf_reports: list[PerfReport]) -> CostBreakdown:
     Returns:
         CostBreakdown with costs by token type.
     """
-    total_input = sum((r.total_input_cost_usd for r in perf_reports), Decimal("0"))
-    total_output = sum((r.total_output_cost_usd for r in perf_reports), Decimal("0"))
-    total_cached = sum((r.total_cached_input_cost_usd for r in perf_reports), Decimal("0"))
-    total_audio_in = sum((r.total_audio_input_cost_usd for r in perf_reports), Decimal("0"))
-    total_audio_out = sum((r.total_audio_output_cost_usd for r in perf_reports), Decimal("0"))
-    total_audio = total_audio_in + total_audio_out
-    total_cost = sum((r.total_cost_usd for r in perf_reports), Decimal("0"))
+    return build_cost_breakdown(aggregate_perf(perf_reports))
+
 
+def build_cost_breakdown(perf_totals: PerfTotals) -> CostBreakdown:
+    """Build cost breakdown by token type from pre-aggregated totals.
+
+    Args:
+        perf_totals: Totals collected by aggregate_perf.
+
+    Returns:
+        CostBreakdown with costs by token type.
+    """
     return CostBreakdown(
-        total_input_cost_usd=total_input,
-        total_output_cost_usd=total_output,
-        total_cached_cost_usd=total_cached,
-        total_audio_cost_usd=total_audio,
-        total_cost_usd=total_cost,
+        total_input_cost_usd=_to_decimal(perf_totals.input_cost, COST_QUANTUM),
+        total_output_cost_usd=_to_decimal(perf_totals.output_cost, COST_QUANTUM),
+        total_cached_cost_usd=_to_decimal(perf_totals.cached_cost, COST_QUANTUM),
+        total_audio_cost_usd=_to_decimal(perf_totals.audio_cost, COST_QUANTUM),
+        total_cost_usd=_to_decimal(perf_totals.total_cost, COST_QUANTUM),
     )
 
 
@@ -126,26 +357,27 @@ def calculate_cost_by_intent(perf_reports: list[PerfReport]) -> list[IntentCostE
     Returns:
         List of IntentCostEntry sorted by total cost descending.
     """
-    intent_costs: dict[str, Decimal] = {}
-    intent_counts: dict[str, int] = {}
+    return build_cost_by_intent(aggregate_perf(perf_reports))
 
-    for report in perf_reports:
-        for intent_name, totals in report.grouped_totals_by_intent.items():
-            intent_costs[intent_name] = (
-                intent_costs.get(intent_name, Decimal("0")) + totals.total_cost_usd
-            )
-            intent_counts[intent_name] = intent_counts.get(intent_name, 0) + 1
 
+def build_cost_by_intent(perf_totals: PerfTotals) -> list[IntentCostEntry]:
+    """Build cost breakdown by intent from pre-aggregated totals.
+
+    Args:
+        perf_totals: Totals collected by aggregate_perf.
+
+    Returns:
+        List of IntentCostEntry sorted by total cost descending.
+    """
     entries = []
-    for intent_name, total_cost in intent_costs.items():
-        count = intent_counts[intent_name]
-        avg_cost = total_cost / count if count > 0 else Decimal("0")
+    for intent_name, total_cost in perf_totals.intent_costs.items():
+        count = perf_totals.intent_counts[intent_name]
         entries.append(
             IntentCostEntry(
                 intent_name=intent_name,
-                total_cost_usd=total_cost,
+                total_cost_usd=_to_decimal(total_cost, COST_QUANTUM),
                 interaction_count=count,
-                avg_cost_per_interaction=avg_cost,
+                avg_cost_per_interaction=_to_decimal(total_cost / count, COST_QUANTUM),
             )
         )
 
@@ -161,24 +393,40 @@ def calculate_performance_metrics(perf_reports: list[PerfReport]) -> Performance
     Returns:
         PerformanceMetrics with response time stats and slowest spans.
     """
-    if not perf_reports:
+    return build_performance_metrics(aggregate_perf(perf_reports))
+
+
+def build_performance_metrics(perf_totals: PerfTotals) -> PerformanceMetrics:
+    """Build response time statistics from pre-aggregated totals.
+
+    Args:
+        perf_totals: Totals collected by aggregate_perf.
+
+    Returns:
+        PerformanceMetrics with response time stats and slowest spans.
+    """
+    if not perf_totals.response_times:
         return PerformanceMetrics(
-            avg_response_time_ms=Decimal("0"),
-            p50_response_time_ms=Decimal("0"),
-            p95_response_time_ms=Decimal("0"),
-            p99_response_time_ms=Decimal("0"),
+            avg_response_time_ms=ZERO,
+            p50_response_time_ms=ZERO,
+            p95_response_time_ms=ZERO,
+            p99_response_time_ms=ZERO,
             slowest_spans=[],
         )
 
-    response_times = sorted(r.total_ms for r in perf_reports)
-    avg_time = sum(response_times, Decimal("0")) / len(response_times)
+    # Sort the raw floats and convert only the three picked values to Decimal.
+    response_times = sorted(perf_totals.response_times)
+    p50, p95, p99 = (
+        response_times[_percentile_index(len(response_times), percentile)]
+        for percentile in (50, 95, 99)
+    )
 
     return PerformanceMetrics(
-        avg_response_time_ms=avg_time,
-        p50_response_time_ms=calculate_percentile(response_times, 50),
-        p95_response_time_ms=calculate_percentile(response_times, 95),
-        p99_response_time_ms=calculate_percentile(response_times, 99),
-        slowest_spans=identify_bottleneck_spans(perf_reports),
+        avg_response_time_ms=_to_decimal(statistics.fmean(response_times), DURATION_QUANTUM),
+        p50_response_time_ms=_to_decimal(p50, DURATION_QUANTUM),
+        p95_response_time_ms=_to_decimal(p95, DURATION_QUANTUM),
+        p99_response_time_ms=_to_decimal(p99, DURATION_QUANTUM),
+        slowest_spans=build_bottleneck_spans(perf_totals),
     )
 
 
@@ -193,10 +441,9 @@ def calculate_percentile(values: list[Decimal], percentile: int) -> Decimal:
         The value at the given percentile.
     """
     if not values:
-        return Decimal("0")
+        return ZERO
 
-    index = (len(values) - 1) * percentile // 100
-    return values[index]
+    return values[_percentile_index(len(values), percentile)]
 
 
 def identify_bottleneck_spans(
@@ -211,20 +458,26 @@ def identify_bottleneck_spans(
     Returns:
         List of (span_name, avg_duration_ms) tuples, sorted by duration descending.
     """
-    span_totals: dict[str, Decimal] = {}
-    span_counts: dict[str, int] = {}
+    return build_bottleneck_spans(aggregate_perf(perf_reports), top_n)
 
-    for report in perf_reports:
-        for span in report.spans:
-            span_totals[span.name] = span_totals.get(span.name, Decimal("0")) + span.duration_ms
-            span_counts[span.name] = span_counts.get(span.name, 0) + 1
 
-    span_avgs = []
-    for name, total in span_totals.items():
-        avg = total / span_counts[name]
-        span_avgs.append((name, avg))
+def build_bottleneck_spans(perf_totals: PerfTotals, top_n: int = 5) -> list[tuple[str, Decimal]]:
+    """Identify the slowest spans from pre-aggregated totals.
+
+    Args:
+        perf_totals: Totals collected by aggregate_perf.
+        top_n: Number of top spans to return.
+
+    Returns:
+        List of (span_name, avg_duration_ms) tuples, sorted by duration descending.
+    """
+    span_counts = perf_totals.span_counts
+    span_avgs = (
+        (name, total / span_counts[name]) for name, total in perf_totals.span_totals.items()
+    )
+    slowest = heapq.nlargest(top_n, span_avgs, key=itemgetter(1))
 
-    return sorted(span_avgs, key=lambda x: x[1], reverse=True)[:top_n]
+    return [(name, _to_decimal(avg, DURATION_QUANTUM)) for name, avg in slowest]
 
 
 def calculate_usage_analytics(log_entries: list[LogEntry]) -> UsageAnalytics:
@@ -236,17 +489,24 @@ def calculate_usage_analytics(log_entries: list[LogEntry]) -> UsageAnalytics:
     Returns:
         UsageAnalytics with user counts, intent distribution, and languages.
     """
-    unique_users = extract_unique_users(log_entries)
-    intents = extract_intents(log_entries)
-    languages = extract_languages(log_entries)
+    return build_usage_analytics(aggregate_logs(log_entries))
+
 
-    intent_counter = Counter(intents)
-    top_intents = intent_counter.most_common(10)
+def build_usage_analytics(log_totals: LogTotals) -> UsageAnalytics:
+    """Build usage analytics from pre-aggregated totals.
+
+    Args:
+        log_totals: Totals collected by aggregate_logs.
+
+    Returns:
+        UsageAnalytics with user counts, intent distribution, and languages.
+    """
+    top_intents = heapq.nlargest(10, log_totals.intent_counts.items(), key=itemgetter(1))
 
     return UsageAnalytics(
-        unique_users=len(unique_users),
+        unique_users=len(log_totals.users),
         top_intents=top_intents,
-        language_distribution=languages,
+        language_distribution=dict(log_totals.languages),
     )
 
 
@@ -259,24 +519,34 @@ def calculate_system_health(log_entries: list[LogEntry]) -> SystemHealth:
     Returns:
         SystemHealth with error/warning counts and success rate.
     """
-    level_counts = count_by_level(log_entries)
-    warnings = extract_warnings(log_entries)
-    errors = extract_errors(log_entries)
+    return build_system_health(aggregate_logs(log_entries))
+
+
+def build_system_health(log_totals: LogTotals) -> SystemHealth:
+    """Build system health metrics from pre-aggregated totals.
+
+    Args:
+        log_totals: Totals collected by aggregate_logs.
+
+    Returns:
+        SystemHealth with error/warning counts and success rate.
+    """
+    level_counts = log_totals.level_counts
 
     total_requests = sum(level_counts.values())
     warning_count = level_counts.get("WARNING", 0)
     error_count = level_counts.get("ERROR", 0)
 
     success_count = total_requests - error_count
-    success_rate = Decimal("100")
+    success_rate = HUNDRED
     if total_requests > 0:
-        success_rate = Decimal(success_count) / Decimal(total_requests) * 100
+        success_rate = Decimal(success_count) / Decimal(total_requests) * HUNDRED
 
     return SystemHealth(
         total_requests=total_requests,
         warning_count=warning_count,
         error_count=error_count,
-        success_rate_percent=success_rate.quantize(Decimal("0.01")),
-        warning_messages=warnings[:10],
-        error_messages=errors[:10],
+        success_rate_percent=success_rate.quantize(PERCENT_QUANTUM),
+        warning_messages=list(islice(log_totals.warnings, 10)),
+        error_messages=list(islice(log_totals.errors, 10)),
     )
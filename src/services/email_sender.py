@@ -1,15 +1,43 @@
 """Email sender service for report delivery."""
 
+import base64
+import contextlib
 import smtplib
+from email.encoders import encode_noop
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
+from types import TracebackType
 
 from src.models.config import AppConfig
 from src.models.report_data import ReportData
 
 
+# A multiple of 57 bytes, the input size of one 76-character base64 line, so
+# encoded chunks concatenate into exactly what a one-shot encode would produce.
+ATTACHMENT_CHUNK_SIZE = 57 * 1024
+
+
+def _encode_file_base64(path: Path) -> str:
+    """Base64-encode a file into MIME-wrapped lines, reading it in chunks.
+
+    Only one chunk of raw bytes is held at a time, instead of the whole file
+    alongside its encoded copy.
+
+    Args:
+        path: File to encode.
+
+    Returns:
+        Base64 text wrapped at 76 characters per line.
+    """
+    encoded: list[bytes] = []
+    with path.open("rb") as file:
+        while chunk := file.read(ATTACHMENT_CHUNK_SIZE):
+            encoded.append(base64.encodebytes(chunk))
+    return b"".join(encoded).decode("ascii")
+
+
 class EmailSender:
     """Sends email reports with HTML body and PDF attachment."""
 
@@ -20,6 +48,31 @@ class EmailSender:
             config: Application configuration with SMTP settings.
         """
         self._config = config
+        self._server: smtplib.SMTP | None = None
+        self._from_header = config.email_from
+        self._to_header = ", ".join(config.email_to)
+
+    @property
+    def recipients(self) -> tuple[str, ...]:
+        """Addresses each report is sent to."""
+        return tuple(self._config.email_to)
+
+    def __enter__(self) -> "EmailSender":
+        """Enter context manager, opening one SMTP session for all sends."""
+        self._server = self._connect()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager, closing the SMTP session."""
+        if self._server:
+            with contextlib.suppress(smtplib.SMTPServerDisconnected):
+                self._server.quit()
+            self._server = None
 
     def send_report(
         self,
@@ -73,33 +126,78 @@ class EmailSender:
         """
         message = MIMEMultipart("mixed")
         message["Subject"] = subject
-        message["From"] = self._config.email_from
-        message["To"] = ", ".join(self._config.email_to)
+        message["From"] = self._from_header
+        message["To"] = self._to_header
 
         html_part = MIMEText(html_body, "html")
         message.attach(html_part)
 
-        with pdf_path.open("rb") as pdf_file:
-            pdf_part = MIMEApplication(pdf_file.read(), _subtype="pdf")
-            pdf_part.add_header(
-                "Content-Disposition",
-                "attachment",
-                filename=pdf_path.name,
-            )
-            message.attach(pdf_part)
+        pdf_part = MIMEApplication(
+            _encode_file_base64(pdf_path), _subtype="pdf", _encoder=encode_noop
+        )
+        pdf_part["Content-Transfer-Encoding"] = "base64"
+        pdf_part.add_header(
+            "Content-Disposition",
+            "attachment",
+            filename=pdf_path.name,
+        )
+        message.attach(pdf_part)
 
         return message
 
     def _send_message(self, message: MIMEMultipart) -> None:
         """Send email via SMTP.
 
+        Inside a ``with`` block the open session is reused; otherwise a
+        session is opened and closed just for this message.
+
         Args:
             message: Constructed email message.
         """
+        if self._server is not None:
+            self._ensure_server().send_message(message)
+            return
+
         with smtplib.SMTP(self._config.smtp_host, self._config.smtp_port) as server:
-            server.starttls()
-            server.login(
-                self._config.smtp_user,
-                self._config.smtp_password.get_secret_value(),
-            )
+            self._start_session(server)
             server.send_message(message)
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an authenticated SMTP session.
+
+        Returns:
+            SMTP client after STARTTLS and login.
+        """
+        server = smtplib.SMTP(self._config.smtp_host, self._config.smtp_port)
+        try:
+            self._start_session(server)
+        except smtplib.SMTPException:
+            server.close()
+            raise
+        return server
+
+    def _start_session(self, server: smtplib.SMTP) -> None:
+        """Upgrade the connection to TLS and log in.
+
+        Args:
+            server: Connected SMTP client.
+        """
+        server.starttls()
+        server.login(
+            self._config.smtp_user,
+            self._config.smtp_password.get_secret_value(),
+        )
+
+    def _ensure_server(self) -> smtplib.SMTP:
+        """Return the open session, reconnecting if the server dropped it.
+
+        Returns:
+            A live SMTP client.
+        """
+        if self._server is not None:
+            with contextlib.suppress(smtplib.SMTPServerDisconnected):
+                if self._server.noop()[0] == 250:
+                    return self._server
+            self._server.close()
+        self._server = self._connect()
+        return self._server
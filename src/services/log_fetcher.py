@@ -1,18 +1,27 @@
 """Log fetcher service for bt-servant-engine API."""
 
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
+from itertools import islice
 from types import TracebackType
 
 import httpx
 
-from src.models.config import AppConfig
+from src.models.config import ApiConfig
 from src.models.log_entry import LogFilesPayload
+from src.parsers.log_parser import iter_lines
+
+
+MAX_CONCURRENT_DOWNLOADS = 8
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 
 class LogFetcher:
     """Client for fetching logs from bt-servant-engine API."""
 
-    def __init__(self, config: AppConfig) -> None:
+    def __init__(self, config: ApiConfig) -> None:
         """Initialize the log fetcher.
 
         Args:
@@ -22,11 +31,23 @@ class LogFetcher:
         self._client: httpx.Client | None = None
 
     def __enter__(self) -> "LogFetcher":
-        """Enter context manager, creating HTTP client."""
+        """Enter context manager, creating HTTP client.
+
+        The client negotiates HTTP/2 so concurrent downloads multiplex over
+        one TLS connection, and its pool is sized to the download window.
+        With the zstd extra installed, httpx advertises and decodes zstd
+        alongside gzip, so compressible log bodies cross the wire smaller.
+        """
         self._client = httpx.Client(
             base_url=self._config.bt_servant_api_url,
             headers=self._build_auth_headers(),
-            timeout=60.0,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENT_DOWNLOADS,
+                max_keepalive_connections=MAX_CONCURRENT_DOWNLOADS,
+                keepalive_expiry=60.0,
+            ),
         )
         return self
 
@@ -76,7 +97,7 @@ class LogFetcher:
         client = self._ensure_client()
         response = client.get("/admin/logs/files")
         response.raise_for_status()
-        return LogFilesPayload.model_validate(response.json())
+        return LogFilesPayload.model_validate_json(response.content)
 
     def list_recent_files(self, days: int = 7, limit: int = 100) -> LogFilesPayload:
         """List recent log files.
@@ -97,11 +118,14 @@ class LogFetcher:
             params={"days": days, "limit": limit},
         )
         response.raise_for_status()
-        return LogFilesPayload.model_validate(response.json())
+        return LogFilesPayload.model_validate_json(response.content)
 
     def download_log_file(self, filename: str) -> str:
         """Download a specific log file.
 
+        The body is streamed and decoded chunk by chunk, so the raw bytes of
+        the whole file are never held alongside the decoded text.
+
         Args:
             filename: Name of the log file to download.
 
@@ -112,9 +136,9 @@ class LogFetcher:
             httpx.HTTPStatusError: If API returns error status.
         """
         client = self._ensure_client()
-        response = client.get(f"/admin/logs/files/{filename}")
-        response.raise_for_status()
-        return response.text
+        with client.stream("GET", f"/admin/logs/files/{filename}") as response:
+            response.raise_for_status()
+            return "".join(response.iter_text(DOWNLOAD_CHUNK_SIZE))
 
     def fetch_logs_for_period(self, start_date: date, end_date: date) -> str:
         """Fetch and concatenate all log files for the given date range.
@@ -126,12 +150,69 @@ class LogFetcher:
         Returns:
             Concatenated content of all relevant log files.
         """
+        return "\n".join(self._iter_downloads(self._files_in_period(start_date, end_date)))
+
+    def iter_log_lines(self, start_date: date, end_date: date) -> Iterator[str]:
+        """Yield the lines of every log file for the given date range.
+
+        Files are consumed as soon as they arrive, so at most a window of
+        MAX_CONCURRENT_DOWNLOADS files is held in memory rather than the
+        whole period.
+
+        Args:
+            start_date: Start date of the period.
+            end_date: End date of the period.
+
+        Yields:
+            Log lines in file listing order.
+        """
+        for content in self._iter_downloads(self._files_in_period(start_date, end_date)):
+            yield from iter_lines(content)
+
+    def _files_in_period(self, start_date: date, end_date: date) -> list[str]:
+        """List the names of log files last modified within the date range.
+
+        Args:
+            start_date: Start date of the period.
+            end_date: End date of the period.
+
+        Returns:
+            File names in listing order.
+        """
         days = (end_date - start_date).days + 1
         files_payload = self.list_recent_files(days=min(days, 90), limit=500)
 
-        all_content: list[str] = []
-        for file_entry in files_payload.files:
-            content = self.download_log_file(file_entry.name)
-            all_content.append(content)
+        return [
+            file_entry.name
+            for file_entry in files_payload.files
+            if start_date <= file_entry.modified_at.date() <= end_date
+        ]
+
+    def _iter_downloads(self, filenames: list[str]) -> Iterator[str]:
+        """Download files concurrently, yielding their contents in order.
+
+        Downloads share the thread-safe client. A new download is started
+        only as each finished one is handed over, which bounds how many file
+        bodies are held at once.
 
-        return "\n".join(all_content)
+        Args:
+            filenames: Names of the files to download.
+
+        Yields:
+            Content of each file, in the order given.
+        """
+        if not filenames:
+            return
+
+        remaining = iter(filenames)
+        workers = min(MAX_CONCURRENT_DOWNLOADS, len(filenames))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: deque[Future[str]] = deque(
+                executor.submit(self.download_log_file, filename)
+                for filename in islice(remaining, workers)
+            )
+            while pending:
+                content = pending.popleft().result()
+                for filename in islice(remaining, 1):
+                    pending.append(executor.submit(self.download_log_file, filename))
+                yield content
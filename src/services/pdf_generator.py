@@ -1,12 +1,98 @@
 """PDF generator service using WeasyPrint."""
 
+import contextlib
+import functools
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    TemplateError,
+)
 
 from src.models.report_data import ReportData
 
 
+if TYPE_CHECKING:
+    from weasyprint import CSS
+
+
+COMPILED_TEMPLATES_ARCHIVE = "compiled_templates.zip"
+DOCUMENT_TEMPLATE = "report.html.jinja"
+BODY_TEMPLATE = "report_body.html.jinja"
+DOCUMENT_END = "\n</body>\n</html>\n"
+
+
+def _archive_is_current(archive: Path, template_dir: Path) -> bool:
+    """Check that a compiled template archive is at least as new as its sources.
+
+    Args:
+        archive: Path to the compiled template archive.
+        template_dir: Directory containing the template sources.
+
+    Returns:
+        True if the archive exists and no template was modified after it.
+    """
+    if not archive.is_file():
+        return False
+    built_ns = archive.stat().st_mtime_ns
+    return all(source.stat().st_mtime_ns <= built_ns for source in template_dir.glob("*.jinja"))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_environment(template_dir: Path) -> Environment:
+    """Return the shared Jinja2 environment for a template directory.
+
+    Sharing one environment per directory keeps Jinja's compiled-template
+    cache alive across PdfGenerator instances. Templates ship with the
+    package, so auto_reload is off and get_template skips the mtime check.
+    Compiled bytecode is also cached on disk (in Jinja's per-user temp
+    directory) so each short-lived CLI run skips parsing and code generation.
+
+    If an archive written by PdfGenerator.precompile_templates is present and
+    newer than every template source, templates are imported from it as
+    Python modules instead. A stale archive is ignored.
+
+    Args:
+        template_dir: Directory containing templates.
+
+    Returns:
+        Jinja2 Environment loading from template_dir.
+    """
+    archive = template_dir / COMPILED_TEMPLATES_ARCHIVE
+    loader: BaseLoader = (
+        ModuleLoader(str(archive))
+        if _archive_is_current(archive, template_dir)
+        else FileSystemLoader(str(template_dir))
+    )
+    return Environment(
+        loader=loader,
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_stylesheet(css_path: Path) -> "CSS":
+    """Parse a stylesheet once per process for reuse across PDFs.
+
+    Args:
+        css_path: Path to the CSS file.
+
+    Returns:
+        Parsed WeasyPrint stylesheet.
+    """
+    from weasyprint import CSS
+
+    return CSS(filename=str(css_path))
+
+
 class PdfGenerator:
     """Generates PDF reports from HTML templates using WeasyPrint."""
 
@@ -19,10 +105,47 @@ class PdfGenerator:
         if template_dir is None:
             template_dir = Path(__file__).parent.parent.parent / "templates"
         self._template_dir = template_dir
-        self._env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=True,
-        )
+        self._env = _get_environment(template_dir)
+        self._rendered_body: tuple[ReportData, str] | None = None
+        self._body_lock = threading.Lock()
+
+    def warm_up(self) -> None:
+        """Load WeasyPrint and lay out a trivial document.
+
+        The first PDF pays for importing WeasyPrint and initialising
+        fontconfig, Pango, and Cairo. Calling this from a background thread
+        while logs download moves that cost off the critical path. Failures
+        are ignored here; the real compile reports them.
+        """
+        with contextlib.suppress(ImportError, OSError):
+            from weasyprint import HTML
+
+            HTML(string="<p></p>").write_pdf()
+
+    def precompile_templates(self) -> Path:
+        """Compile the Jinja2 templates ahead of time into a zip archive.
+
+        The archive is written next to the templates and picked up by new
+        processes in place of the template sources. Once a template is edited
+        the archive is out of date and the sources are loaded again until
+        this is rerun.
+
+        Returns:
+            Path to the written archive.
+
+        Raises:
+            RuntimeError: If a template fails to compile.
+        """
+        target = self._template_dir / COMPILED_TEMPLATES_ARCHIVE
+        env = Environment(loader=FileSystemLoader(str(self._template_dir)), autoescape=True)
+        try:
+            env.compile_templates(
+                str(target), extensions=["jinja"], zip="stored", ignore_errors=False
+            )
+        except TemplateError as err:
+            msg = f"Failed to compile templates: {err}"
+            raise RuntimeError(msg) from err
+        return target
 
     def generate(self, report_data: ReportData, output_path: Path) -> Path:
         """Generate PDF from report data.
@@ -47,9 +170,43 @@ class PdfGenerator:
         Returns:
             Rendered HTML string.
         """
-        template = self._env.get_template("report.html.jinja")
-        result: str = template.render(report=report_data)
-        return result
+        return self._render_document(report_data, inline_styles=False)
+
+    def _render_body(self, report_data: ReportData) -> str:
+        """Render the report body, reusing the last result for the same data.
+
+        The PDF and email documents differ only in their <head>, so the body
+        is rendered once per ReportData and shared by both, even when the two
+        are rendered from different threads.
+
+        Args:
+            report_data: Data to render into the template.
+
+        Returns:
+            Rendered body HTML.
+        """
+        with self._body_lock:
+            cached = self._rendered_body
+            if cached is not None and cached[0] is report_data:
+                return cached[1]
+
+            template = self._env.get_template(BODY_TEMPLATE)
+            body: str = template.render(report=report_data)
+            self._rendered_body = (report_data, body)
+            return body
+
+    def _render_document(self, report_data: ReportData, *, inline_styles: bool) -> str:
+        """Join the document head, the shared report body, and the closing tags.
+
+        Args:
+            report_data: Data to render into the template.
+            inline_styles: Embed styles in a <style> tag instead of linking report.css.
+
+        Returns:
+            Rendered HTML string.
+        """
+        head = self._env.get_template(DOCUMENT_TEMPLATE).render(inline_styles=inline_styles)
+        return head + "\n" + self._render_body(report_data) + DOCUMENT_END
 
     def _compile_pdf(self, html_content: str, output_path: Path) -> None:
         """Compile HTML to PDF using WeasyPrint.
@@ -62,7 +219,7 @@ class PdfGenerator:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
         css_path = self._template_dir / "report.css"
-        stylesheets = [str(css_path)] if css_path.exists() else None
+        stylesheets = [_load_stylesheet(css_path)] if css_path.exists() else None
         HTML(string=html_content, base_url=str(self._template_dir)).write_pdf(
             output_path, stylesheets=stylesheets
         )
@@ -76,6 +233,4 @@ class PdfGenerator:
         Returns:
             Rendered HTML string with inline styles.
         """
-        template = self._env.get_template("report.html.jinja")
-        result: str = template.render(report=report_data, inline_styles=True)
-        return result
+        return self._render_document(report_data, inline_styles=True)
@@ -1,71 +1,120 @@
 """Report generator service orchestrating the full pipeline."""
 
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 
-from src.models.config import AppConfig, ReportPeriod
+from src.models.config import ApiConfig, AppConfig, ReportPeriod
 from src.models.report_data import ReportData
-from src.parsers.log_parser import extract_perf_reports, parse_log_lines
-from src.parsers.metrics_aggregator import aggregate_metrics
+from src.parsers.log_parser import parse_log_lines
+from src.parsers.metrics_aggregator import aggregate_log_stream
 from src.services.email_sender import EmailSender
 from src.services.log_fetcher import LogFetcher
 from src.services.pdf_generator import PdfGenerator
 
 
+@dataclass(frozen=True)
+class ReportResult:
+    """Outcome of a report run."""
+
+    pdf_path: Path
+    emailed_to: tuple[str, ...] = ()
+
+    @property
+    def email_sent(self) -> bool:
+        """Whether the report was emailed."""
+        return bool(self.emailed_to)
+
+
 class ReportGenerator:
     """Orchestrates the full report generation and delivery pipeline."""
 
-    def __init__(self, config: AppConfig) -> None:
+    def __init__(self, config: ApiConfig, *, send_email: bool = True) -> None:
         """Initialize the report generator.
 
         Args:
-            config: Application configuration.
+            config: Application configuration. Email delivery requires an
+                AppConfig; an ApiConfig is enough to fetch and render reports.
+            send_email: Whether generate_and_send emails the report.
+
+        Raises:
+            RuntimeError: If send_email is set but config has no email settings.
         """
         self._config = config
         self._pdf_generator = PdfGenerator()
-        self._email_sender = EmailSender(config)
+        self._email_sender: EmailSender | None = None
+        if send_email:
+            if not isinstance(config, AppConfig):
+                msg = "Email settings are not configured; cannot send the report"
+                raise RuntimeError(msg)
+            self._email_sender = EmailSender(config)
 
     def generate_and_send(
         self,
         start_date: date | None = None,
         end_date: date | None = None,
-        send_email: bool = True,
-    ) -> Path:
-        """Generate report and optionally send via email.
+    ) -> ReportResult:
+        """Generate report and send it via email if enabled.
 
         Args:
             start_date: Report start date. Defaults based on period.
             end_date: Report end date. Defaults to yesterday.
-            send_email: Whether to send the email.
 
         Returns:
-            Path to the generated PDF file.
+            ReportResult with the PDF path and the recipients emailed, if any.
         """
         start_date, end_date = self.resolve_dates(start_date, end_date)
-        log_content = self.fetch_logs(start_date, end_date)
-        report_data = self.process_logs(log_content, start_date, end_date)
-        pdf_path = self._generate_pdf(report_data, start_date, end_date)
 
-        if send_email:
-            self._send_email(report_data, pdf_path)
-
-        return pdf_path
+        # Warm up WeasyPrint while the logs download and aggregate. The thread is
+        # a daemon and only joined once the data is ready, so a failed fetch is
+        # reported straight away instead of after the warm-up. An unexpected
+        # warm-up error goes to threading.excepthook.
+        warm_up = threading.Thread(
+            target=self._pdf_generator.warm_up, name="pdf-warm-up", daemon=True
+        )
+        warm_up.start()
+        log_lines = self.fetch_logs(start_date, end_date)
+        report_data = self.process_logs(log_lines, start_date, end_date)
+        warm_up.join()
+
+        if self._email_sender is None:
+            return ReportResult(self._generate_pdf(report_data, start_date, end_date))
+
+        # WeasyPrint spends most of its time in Cairo/Pango with the GIL
+        # released, so the email HTML is rendered here while the PDF is laid out.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pdf_future = executor.submit(self._generate_pdf, report_data, start_date, end_date)
+            html_body = self._pdf_generator.render_html_for_email(report_data)
+            pdf_path = pdf_future.result()
+
+        self._send_email(report_data, pdf_path, html_body)
+        return ReportResult(pdf_path, self._email_sender.recipients)
 
     def resolve_dates(
         self,
         start_date: date | None,
         end_date: date | None,
+        now: datetime | None = None,
     ) -> tuple[date, date]:
         """Resolve start and end dates based on configuration.
 
         Args:
             start_date: Optional explicit start date.
             end_date: Optional explicit end date.
+            now: Reference time for the default end date. Callers resolving
+                several ranges in one job pass a single captured value so all
+                ranges agree even if the job straddles midnight UTC.
+                Defaults to the current time.
 
         Returns:
             Tuple of (start_date, end_date).
         """
-        today = datetime.now(UTC).date()
+        if now is None:
+            now = datetime.now(UTC)
+        today = now.date()
         yesterday = today - timedelta(days=1)
 
         if end_date is None:
@@ -91,42 +140,43 @@ class ReportGenerator:
             return end_date - timedelta(days=6)
         return end_date - timedelta(days=29)
 
-    def fetch_logs(self, start_date: date, end_date: date) -> str:
-        """Fetch logs from the API for the given date range.
+    def fetch_logs(self, start_date: date, end_date: date) -> Iterator[str]:
+        """Stream log lines from the API for the given date range.
+
+        The HTTP client stays open until the returned iterator is exhausted.
 
         Args:
             start_date: Start date of the period.
             end_date: End date of the period.
 
-        Returns:
-            Concatenated log content.
+        Yields:
+            Log lines from every file in the range.
         """
         with LogFetcher(self._config) as fetcher:
-            return fetcher.fetch_logs_for_period(start_date, end_date)
+            yield from fetcher.iter_log_lines(start_date, end_date)
 
     def process_logs(
         self,
-        log_content: str,
+        log_content: str | Iterable[str],
         start_date: date,
         end_date: date,
     ) -> ReportData:
         """Process log content into aggregated report data.
 
         Args:
-            log_content: Raw log content string.
+            log_content: Raw log content string, or an iterable of log lines.
             start_date: Report start date.
             end_date: Report end date.
 
         Returns:
             Aggregated ReportData.
         """
-        log_entries = [
+        log_entries = (
             entry
             for entry in parse_log_lines(log_content)
             if start_date <= entry.timestamp.date() <= end_date
-        ]
-        perf_reports = extract_perf_reports(iter(log_entries))
-        return aggregate_metrics(perf_reports, log_entries, start_date, end_date)
+        )
+        return aggregate_log_stream(log_entries, start_date, end_date)
 
     def _generate_pdf(
         self,
@@ -148,12 +198,27 @@ class ReportGenerator:
         output_path = self._config.report_output_dir / filename
         return self._pdf_generator.generate(report_data, output_path)
 
-    def _send_email(self, report_data: ReportData, pdf_path: Path) -> None:
+    def _send_email(
+        self,
+        report_data: ReportData,
+        pdf_path: Path,
+        html_body: str | None = None,
+    ) -> None:
         """Send report via email.
 
         Args:
             report_data: Report data for email body.
             pdf_path: Path to PDF attachment.
+            html_body: Pre-rendered email HTML. Rendered from report_data if omitted.
+
+        Raises:
+            RuntimeError: If the generator was built with email disabled.
         """
-        html_body = self._pdf_generator.render_html_for_email(report_data)
-        self._email_sender.send_report(report_data, html_body, pdf_path)
+        if self._email_sender is None:
+            msg = "Email sending is disabled for this report generator"
+            raise RuntimeError(msg)
+
+        if html_body is None:
+            html_body = self._pdf_generator.render_html_for_email(report_data)
+        with self._email_sender as sender:
+            sender.send_report(report_data, html_body, pdf_path)
@@ -1,13 +1,32 @@
 """Tests for CLI entry point."""
 
+import subprocess
+import sys
 from datetime import date
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.cli.main import build_config_overrides, create_parser, main, parse_date
 from src.models.config import ReportPeriod
+from src.services.report_generator import ReportResult
+
+
+class TestLazyImports:
+    """Tests for deferred heavy imports."""
+
+    def test_import_does_not_load_services(self) -> None:
+        """Test importing the CLI module does not pull in the service layer."""
+        code = (
+            "import sys, src.cli.main; "
+            "print('src.services.report_generator' in sys.modules, 'pydantic' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False False"
 
 
 class TestParseDate:
@@ -97,6 +116,7 @@ class TestCreateParser:
         assert args.end_date is None
         assert args.no_email is False
         assert args.verbose is False
+        assert args.precompile_templates is False
 
 
 class TestBuildConfigOverrides:
@@ -144,28 +164,85 @@ class TestMain:
     def test_successful_execution_returns_zero(self, tmp_path: Path) -> None:
         """Test successful execution returns exit code 0."""
         with (
-            patch("src.cli.main.AppConfig") as mock_config_class,
-            patch("src.cli.main.ReportGenerator") as mock_generator_class,
+            patch("src.models.config.get_config") as mock_get_config,
+            patch("src.services.report_generator.ReportGenerator") as mock_generator_class,
         ):
-            mock_config = MagicMock()
-            mock_config.bt_servant_api_url = "https://api.test.com"
-            mock_config.report_period.value = "daily"
-            mock_config.report_output_dir = tmp_path
-            mock_config.email_to = ["user@test.com"]
-            mock_config_class.return_value = mock_config
+            mock_config = SimpleNamespace(
+                bt_servant_api_url="https://api.test.com",
+                report_period=SimpleNamespace(value="daily"),
+                report_output_dir=tmp_path,
+                email_to=["user@test.com"],
+            )
+            mock_get_config.return_value = mock_config
 
             mock_generator = MagicMock()
-            mock_generator.generate_and_send.return_value = tmp_path / "report.pdf"
+            mock_generator.generate_and_send.return_value = ReportResult(tmp_path / "report.pdf")
             mock_generator_class.return_value = mock_generator
 
             result = main([])
 
             assert result == 0
 
+    @pytest.mark.parametrize(
+        ("emailed_to", "expected"),
+        [(("user@test.com",), True), ((), False)],
+    )
+    def test_reports_email_only_when_sent(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture,
+        emailed_to: tuple[str, ...],
+        expected: bool,
+    ) -> None:
+        """Test the email confirmation reflects what the generator actually did."""
+        with (
+            patch("src.models.config.get_config") as mock_get_config,
+            patch("src.services.report_generator.ReportGenerator") as mock_generator_class,
+        ):
+            mock_get_config.return_value = SimpleNamespace(email_to=["user@test.com"])
+            mock_generator_class.return_value.generate_and_send.return_value = ReportResult(
+                tmp_path / "report.pdf", emailed_to
+            )
+
+            assert main([]) == 0
+
+        assert ("Email sent to: user@test.com" in capsys.readouterr().out) is expected
+
+    def test_precompile_templates_exits_without_config(self, tmp_path: Path) -> None:
+        """Test --precompile-templates compiles and exits before loading config."""
+        with (
+            patch("src.models.config.get_config") as mock_get_config,
+            patch("src.services.pdf_generator.PdfGenerator") as mock_generator_class,
+        ):
+            mock_generator_class.return_value.precompile_templates.return_value = (
+                tmp_path / "compiled_templates.zip"
+            )
+
+            result = main(["--precompile-templates"])
+
+            assert result == 0
+            mock_generator_class.return_value.precompile_templates.assert_called_once()
+            mock_get_config.assert_not_called()
+
+    def test_precompile_templates_error_returns_nonzero(
+        self,
+        capsys: pytest.CaptureFixture,
+    ) -> None:
+        """Test a failed --precompile-templates reports the error instead of a traceback."""
+        with patch("src.services.pdf_generator.PdfGenerator") as mock_generator_class:
+            mock_generator_class.return_value.precompile_templates.side_effect = OSError(
+                "read-only file system"
+            )
+
+            result = main(["--precompile-templates"])
+
+        assert result == 1
+        assert "Error: read-only file system" in capsys.readouterr().err
+
     def test_error_returns_nonzero(self) -> None:
         """Test error returns non-zero exit code."""
-        with patch("src.cli.main.AppConfig") as mock_config_class:
-            mock_config_class.side_effect = ValueError("Config error")
+        with patch("src.models.config.get_config") as mock_get_config:
+            mock_get_config.side_effect = ValueError("Config error")
 
             result = main([])
 
@@ -174,24 +251,25 @@ class TestMain:
     def test_no_email_flag_skips_email(self, tmp_path: Path) -> None:
         """Test --no-email flag skips email sending."""
         with (
-            patch("src.cli.main.AppConfig") as mock_config_class,
-            patch("src.cli.main.ReportGenerator") as mock_generator_class,
+            patch("src.models.config.get_config") as mock_get_config,
+            patch("src.services.report_generator.ReportGenerator") as mock_generator_class,
         ):
-            mock_config = MagicMock()
-            mock_config.bt_servant_api_url = "https://api.test.com"
-            mock_config.report_period.value = "daily"
-            mock_config.report_output_dir = tmp_path
-            mock_config_class.return_value = mock_config
+            mock_config = SimpleNamespace(
+                bt_servant_api_url="https://api.test.com",
+                report_period=SimpleNamespace(value="daily"),
+                report_output_dir=tmp_path,
+            )
+            mock_get_config.return_value = mock_config
 
             mock_generator = MagicMock()
-            mock_generator.generate_and_send.return_value = tmp_path / "report.pdf"
+            mock_generator.generate_and_send.return_value = ReportResult(tmp_path / "report.pdf")
             mock_generator_class.return_value = mock_generator
 
             main(["--no-email"])
 
+            assert mock_get_config.call_args.kwargs["include_email"] is False
             mock_generator.generate_and_send.assert_called_once()
-            call_kwargs = mock_generator.generate_and_send.call_args[1]
-            assert call_kwargs["send_email"] is False
+            assert mock_generator_class.call_args.kwargs["send_email"] is False
 
     def test_custom_period_requires_dates(self) -> None:
         """Test custom period requires start and end dates."""
@@ -202,18 +280,19 @@ class TestMain:
     def test_verbose_prints_config(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
         """Test verbose flag prints configuration info."""
         with (
-            patch("src.cli.main.AppConfig") as mock_config_class,
-            patch("src.cli.main.ReportGenerator") as mock_generator_class,
+            patch("src.models.config.get_config") as mock_get_config,
+            patch("src.services.report_generator.ReportGenerator") as mock_generator_class,
         ):
-            mock_config = MagicMock()
-            mock_config.bt_servant_api_url = "https://api.test.com"
-            mock_config.report_period.value = "daily"
-            mock_config.report_output_dir = tmp_path
-            mock_config.email_to = ["user@test.com"]
-            mock_config_class.return_value = mock_config
+            mock_config = SimpleNamespace(
+                bt_servant_api_url="https://api.test.com",
+                report_period=SimpleNamespace(value="daily"),
+                report_output_dir=tmp_path,
+                email_to=["user@test.com"],
+            )
+            mock_get_config.return_value = mock_config
 
             mock_generator = MagicMock()
-            mock_generator.generate_and_send.return_value = tmp_path / "report.pdf"
+            mock_generator.generate_and_send.return_value = ReportResult(tmp_path / "report.pdf")
             mock_generator_class.return_value = mock_generator
 
             main(["-v"])
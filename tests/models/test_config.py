@@ -0,0 +1,71 @@
+"""Tests for application configuration."""
+
+from pathlib import Path
+
+import pytest
+
+from src.models.config import ApiConfig, AppConfig, ReportPeriod, get_config
+
+
+REQUIRED_FIELDS: dict[str, object] = {
+    "bt_servant_api_url": "https://api.test.com",
+    "bt_servant_api_token": "test-token",
+    "smtp_user": "user",
+    "smtp_password": "password",
+    "email_from": "sender@example.com",
+}
+
+
+class TestGetConfig:
+    """Tests for config construction."""
+
+    def test_returns_app_config(self) -> None:
+        """Test overrides are applied to the built config."""
+        config = get_config(**REQUIRED_FIELDS, email_to=["a@example.com"], report_period="weekly")
+
+        assert isinstance(config, AppConfig)
+        assert config.report_period == ReportPeriod.WEEKLY
+        assert config.email_to == ["a@example.com"]
+
+    def test_reads_environment_on_each_call(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a changed environment is picked up by the next call."""
+        monkeypatch.setenv("SMTP_HOST", "first.example.com")
+        first = get_config(**REQUIRED_FIELDS, email_to=["a@example.com"])
+        monkeypatch.setenv("SMTP_HOST", "second.example.com")
+        second = get_config(**REQUIRED_FIELDS, email_to=["a@example.com"])
+
+        assert isinstance(first, AppConfig)
+        assert isinstance(second, AppConfig)
+        assert first.smtp_host == "first.example.com"
+        assert second.smtp_host == "second.example.com"
+
+    def test_without_email_skips_smtp_fields(self) -> None:
+        """Test SMTP/email settings are not required when email is disabled."""
+        config = get_config(
+            include_email=False,
+            bt_servant_api_url="https://api.test.com",
+            bt_servant_api_token="test-token",
+        )
+
+        assert isinstance(config, ApiConfig)
+        assert not isinstance(config, AppConfig)
+        assert config.bt_servant_api_url == "https://api.test.com"
+
+
+class TestDotEnvLoading:
+    """Tests for reading settings from .env."""
+
+    def test_changed_env_file_is_picked_up(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test each config build reads the current .env contents."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("BT_SERVANT_API_URL", raising=False)
+        monkeypatch.delenv("BT_SERVANT_API_TOKEN", raising=False)
+        env_file = tmp_path / ".env"
+
+        env_file.write_text("BT_SERVANT_API_URL=https://first.test\nBT_SERVANT_API_TOKEN=t\n")
+        assert get_config(include_email=False).bt_servant_api_url == "https://first.test"
+
+        env_file.write_text("BT_SERVANT_API_URL=https://second.test\nBT_SERVANT_API_TOKEN=t\n")
+        assert get_config(include_email=False).bt_servant_api_url == "https://second.test"
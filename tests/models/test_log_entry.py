@@ -1,6 +1,6 @@
 """Tests for log entry models."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
 
@@ -51,6 +51,39 @@ class TestLogEntry:
         assert entry.task_name is None
         assert entry.user == "-"
 
+    def test_parse_space_separated_timestamp(self) -> None:
+        """Test the log timestamp format parses to the expected naive datetime."""
+        data = {
+            "message": "Test message",
+            "timestamp": "2025-12-09 22:30:35",
+            "level": "INFO",
+            "logger": "test.logger",
+            "client_ip": "172.17.0.1",
+            "cid": "abc123",
+            "user": "user123",
+            "schema_version": "1.0.0",
+        }
+
+        entry = LogEntry.model_validate(data)
+
+        assert entry.timestamp.isoformat() == "2025-12-09T22:30:35"
+
+    def test_invalid_timestamp_raises(self) -> None:
+        """Test that a non-ISO timestamp still fails validation."""
+        data = {
+            "message": "Test message",
+            "timestamp": "yesterday",
+            "level": "INFO",
+            "logger": "test.logger",
+            "client_ip": "172.17.0.1",
+            "cid": "abc123",
+            "user": "user123",
+            "schema_version": "1.0.0",
+        }
+
+        with pytest.raises(ValueError, match="validation error"):
+            LogEntry.model_validate(data)
+
     def test_missing_required_field_raises(self) -> None:
         """Test that missing required fields raise validation error."""
         data = {
@@ -79,6 +112,7 @@ class TestLogFileEntry:
         assert entry.name == "bt_servant.log"
         assert entry.size_bytes == 1024
         assert isinstance(entry.modified_at, datetime)
+        assert entry.modified_at == datetime(2025, 12, 9, 22, 30, 35, tzinfo=UTC)
 
 
 class TestLogFilesPayload:
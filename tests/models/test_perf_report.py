@@ -2,6 +2,9 @@
 
 from decimal import Decimal
 
+import pytest
+from pydantic import ValidationError
+
 from src.models.perf_report import IntentTotals, PerfReport, Span
 
 
@@ -47,6 +50,22 @@ class TestSpan:
         assert span.input_tokens_expended == 290
         assert span.total_cost_usd == Decimal("0.000047")
 
+    def test_span_is_immutable(self) -> None:
+        """Test that parsed spans reject attribute assignment."""
+        span = Span.model_validate(
+            {
+                "name": "brain:translate_responses_node",
+                "duration_ms": 10.0,
+                "duration_se": 0.01,
+                "duration_percentage": "1.0%",
+                "start_offset_ms": 0.0,
+                "token_percentage": "0.0%",
+            }
+        )
+
+        with pytest.raises(ValidationError):
+            span.name = "other"
+
 
 class TestIntentTotals:
     """Tests for IntentTotals model."""
@@ -4,13 +4,31 @@ from src.parsers.log_parser import (
     count_by_level,
     extract_intents,
     extract_languages,
+    extract_perf_report,
     extract_perf_reports,
     extract_unique_users,
     extract_warnings,
+    iter_lines,
     parse_log_lines,
 )
 
 
+class TestIterLines:
+    """Tests for iter_lines function."""
+
+    def test_splits_on_newlines(self) -> None:
+        """Test lines are yielded without trailing newlines."""
+        assert list(iter_lines("a\nb\r\n\nc")) == ["a", "b\r", "", "c"]
+
+    def test_trailing_newline(self) -> None:
+        """Test a trailing newline does not yield an extra empty line."""
+        assert list(iter_lines("a\n")) == ["a"]
+
+    def test_empty_content(self) -> None:
+        """Test empty content yields nothing."""
+        assert not list(iter_lines(""))
+
+
 class TestParseLogLines:
     """Tests for parse_log_lines function."""
 
@@ -42,6 +60,21 @@ class TestParseLogLines:
 
         assert len(entries) == 1
 
+    def test_accepts_iterable_of_lines(
+        self, sample_log_line: str, sample_warning_log_line: str
+    ) -> None:
+        """Test parsing lines that were already split by the caller."""
+        entries = list(parse_log_lines(iter([sample_log_line, "", sample_warning_log_line])))
+
+        assert [entry.level for entry in entries] == ["INFO", "WARNING"]
+
+    def test_skip_truncated_json_object(self, sample_log_line: str) -> None:
+        """Test that lines starting with '{' but failing to parse are skipped."""
+        content = f'{{"message": "cut off\n{sample_log_line}'
+        entries = list(parse_log_lines(content))
+
+        assert len(entries) == 1
+
 
 class TestExtractPerfReports:
     """Tests for extract_perf_reports function."""
@@ -63,6 +96,38 @@ class TestExtractPerfReports:
         assert len(reports) == 0
 
 
+class TestExtractPerfReport:
+    """Tests for extract_perf_report function."""
+
+    def test_extracts_from_single_entry(self, sample_perf_report_log_line: str) -> None:
+        """Test a PerfReport entry yields its report."""
+        entry = next(parse_log_lines(sample_perf_report_log_line))
+        report = extract_perf_report(entry)
+
+        assert report is not None
+        assert report.trace_id == "test123"
+
+    def test_non_object_payload_returns_none(self, sample_log_line: str) -> None:
+        """Test a PerfReport marker without a JSON object payload is ignored."""
+        entry = next(parse_log_lines(sample_log_line))
+        entry = entry.model_copy(update={"message": "PerfReport pending"})
+
+        assert extract_perf_report(entry) is None
+
+    def test_malformed_payload_returns_none(self, sample_log_line: str) -> None:
+        """Test a truncated PerfReport payload is ignored rather than raising."""
+        entry = next(parse_log_lines(sample_log_line))
+        entry = entry.model_copy(update={"message": 'PerfReport {"user_id": "u1", '})
+
+        assert extract_perf_report(entry) is None
+
+    def test_regular_entry_returns_none(self, sample_log_line: str) -> None:
+        """Test non-PerfReport entries yield None."""
+        entry = next(parse_log_lines(sample_log_line))
+
+        assert extract_perf_report(entry) is None
+
+
 class TestExtractIntents:
     """Tests for extract_intents function."""
 
@@ -74,6 +139,35 @@ class TestExtractIntents:
         assert len(intents) == 1
         assert intents[0] == "clear-dev-agentic-mcp"
 
+    def test_extract_multiple_intents(self, sample_intent_log_line: str) -> None:
+        """Test comma-separated intents are split into separate names."""
+        entry = next(parse_log_lines(sample_intent_log_line))
+        entry = entry.model_copy(
+            update={"message": "extracted user intents: get-passage-summary, translate-text"}
+        )
+
+        assert extract_intents([entry]) == ["get-passage-summary", "translate-text"]
+
+    def test_keeps_non_identifier_characters(self, sample_intent_log_line: str) -> None:
+        """Test intent names keep hyphens, dots and inner spaces but lose padding."""
+        entry = next(parse_log_lines(sample_intent_log_line))
+        entry = entry.model_copy(
+            update={
+                "message": "extracted user intents: get-passage-summary,  v2.translate , look up"
+            }
+        )
+
+        assert extract_intents([entry]) == ["get-passage-summary", "v2.translate", "look up"]
+
+    def test_intent_list_ends_at_line_break(self, sample_intent_log_line: str) -> None:
+        """Test text after the intent list's line is not read as an intent."""
+        entry = next(parse_log_lines(sample_intent_log_line))
+        entry = entry.model_copy(
+            update={"message": "extracted user intents: translate-text\nnext: detail"}
+        )
+
+        assert extract_intents([entry]) == ["translate-text"]
+
     def test_no_intents(self, sample_log_line: str) -> None:
         """Test when no intents are found."""
         entries = list(parse_log_lines(sample_log_line))
@@ -111,6 +205,16 @@ class TestExtractWarnings:
         assert len(warnings) == 1
         assert "No follow-up question defined" in warnings[0]
 
+    def test_deduplicates_preserving_order(
+        self, sample_warning_log_line: str, sample_log_line: str
+    ) -> None:
+        """Test repeated warnings are reported once, in first-seen order."""
+        content = "\n".join([sample_warning_log_line, sample_log_line] * 3)
+        entries = list(parse_log_lines(content))
+        warnings = extract_warnings(entries)
+
+        assert len(warnings) == 1
+
     def test_no_warnings(self, sample_log_line: str) -> None:
         """Test when no warnings exist."""
         entries = list(parse_log_lines(sample_log_line))
@@ -130,6 +234,12 @@ class TestCountByLevel:
         assert counts["INFO"] == 3
         assert counts["WARNING"] == 1
 
+    def test_accepts_generator(self, sample_multi_line_logs: str) -> None:
+        """Test counting straight from the parser without a list."""
+        counts = count_by_level(parse_log_lines(sample_multi_line_logs))
+
+        assert counts["INFO"] == 3
+
 
 class TestExtractUniqueUsers:
     """Tests for extract_unique_users function."""
@@ -7,8 +7,13 @@ import pytest
 
 from src.models.log_entry import LogEntry
 from src.models.perf_report import IntentTotals, PerfReport, Span
+from src.parsers.log_parser import extract_intents, extract_languages
 from src.parsers.metrics_aggregator import (
+    aggregate_log_stream,
+    aggregate_logs,
     aggregate_metrics,
+    aggregate_perf,
+    build_performance_metrics,
     calculate_cost_breakdown,
     calculate_cost_by_intent,
     calculate_executive_summary,
@@ -117,6 +122,58 @@ def sample_log_entries() -> list[LogEntry]:
     ]
 
 
+class TestAggregatePerf:
+    """Tests for aggregate_perf function."""
+
+    def test_empty_reports(self) -> None:
+        """Test aggregation of no reports yields zero totals."""
+        result = aggregate_perf([])
+        assert result.interactions == 0
+        assert result.total_ms == 0.0
+        assert not result.intent_costs
+
+    def test_collects_all_totals(self, sample_perf_report: PerfReport) -> None:
+        """Test one pass collects costs, timings, intents, and spans."""
+        result = aggregate_perf(iter([sample_perf_report, sample_perf_report]))
+        assert result.interactions == 2
+        assert result.total_ms == 20000.0
+        assert result.intent_counts["test-intent"] == 2
+        assert result.span_counts["process_message"] == 2
+
+
+class TestAggregateLogs:
+    """Tests for aggregate_logs function."""
+
+    def test_collects_all_totals(self, sample_log_entries: list[LogEntry]) -> None:
+        """Test one pass collects levels, users, intents, languages, and warnings."""
+        result = aggregate_logs(sample_log_entries + sample_log_entries[2:])
+        assert result.level_counts == {"INFO": 2, "WARNING": 2}
+        assert result.users == {"user1"}
+        assert result.intent_counts == {"test-intent": 1}
+        assert result.languages == {"en": 1}
+        assert list(result.warnings) == ["Warning: something happened"]
+        assert not result.errors
+
+    def test_counts_intents_and_language_in_same_message(
+        self, sample_log_entries: list[LogEntry]
+    ) -> None:
+        """Test a message reporting both intents and a language counts both."""
+        entry = sample_log_entries[0].model_copy(
+            update={
+                "message": (
+                    "language code fr detected; extracted user intents: translate-text, summarize"
+                )
+            }
+        )
+
+        result = aggregate_logs([entry])
+
+        assert result.intent_counts == {"translate-text": 1, "summarize": 1}
+        assert result.languages == {"fr": 1}
+        assert list(result.intent_counts.elements()) == extract_intents([entry])
+        assert dict(result.languages) == extract_languages([entry])
+
+
 class TestCalculatePercentile:
     """Tests for calculate_percentile function."""
 
@@ -158,6 +215,12 @@ class TestCalculateCostBreakdown:
         assert result.total_output_cost_usd == Decimal("0.001")
         assert result.total_cost_usd == Decimal("0.0111")
 
+    def test_multiple_reports_sum_exactly(self, sample_perf_report: PerfReport) -> None:
+        """Test float accumulation is quantized back to exact Decimal totals."""
+        result = calculate_cost_breakdown([sample_perf_report] * 3)
+        assert result.total_cost_usd == Decimal("0.0333")
+        assert result.total_cached_cost_usd == Decimal("0.0003")
+
 
 class TestCalculateCostByIntent:
     """Tests for calculate_cost_by_intent function."""
@@ -192,6 +255,29 @@ class TestCalculatePerformanceMetrics:
         assert len(result.slowest_spans) == 2
         assert result.slowest_spans[0][0] == "process_message"
 
+    def test_percentiles_across_reports(self, sample_perf_report: PerfReport) -> None:
+        """Test average and percentiles over many response times."""
+        reports = [
+            sample_perf_report.model_copy(update={"total_ms": Decimal(ms)})
+            for ms in range(100, 0, -1)
+        ]
+        result = calculate_performance_metrics(reports)
+        assert result.avg_response_time_ms == Decimal("50.5")
+        assert result.p50_response_time_ms == Decimal("50")
+        assert result.p95_response_time_ms == Decimal("95")
+        assert result.p99_response_time_ms == Decimal("99")
+
+    def test_does_not_reorder_totals(self, sample_perf_report: PerfReport) -> None:
+        """Test building metrics leaves the accumulated response times untouched."""
+        reports = [
+            sample_perf_report.model_copy(update={"total_ms": Decimal(ms)}) for ms in (30, 10, 20)
+        ]
+        totals = aggregate_perf(reports)
+
+        build_performance_metrics(totals)
+
+        assert totals.response_times == [30.0, 10.0, 20.0]
+
 
 class TestIdentifyBottleneckSpans:
     """Tests for identify_bottleneck_spans function."""
@@ -224,6 +310,19 @@ class TestCalculateUsageAnalytics:
         assert ("test-intent", 1) in result.top_intents
         assert result.language_distribution == {"en": 1}
 
+    def test_top_intents_limited_to_ten(self, sample_log_entries: list[LogEntry]) -> None:
+        """Test only the ten most frequent intents are reported, highest first."""
+        template = sample_log_entries[0]
+        entries = [
+            template.model_copy(update={"message": f"extracted user intents: intent-{i}"})
+            for i in range(12)
+            for _ in range(i + 1)
+        ]
+        result = calculate_usage_analytics(entries)
+        assert len(result.top_intents) == 10
+        assert result.top_intents[0] == ("intent-11", 12)
+        assert ("intent-0", 1) not in result.top_intents
+
 
 class TestCalculateSystemHealth:
     """Tests for calculate_system_health function."""
@@ -296,3 +395,29 @@ class TestAggregateMetrics:
         assert result.usage.unique_users == 1
         assert result.system_health.warning_count == 1
         assert result.system_health.error_messages == []
+
+
+class TestAggregateLogStream:
+    """Tests for aggregate_log_stream function."""
+
+    def test_single_pass_over_generator(
+        self,
+        sample_perf_report: PerfReport,
+        sample_log_entries: list[LogEntry],
+    ) -> None:
+        """Test PerfReports and log totals are collected from one lazy stream."""
+        perf_entry = sample_log_entries[0].model_copy(
+            update={"message": f"PerfReport {sample_perf_report.model_dump_json()}"}
+        )
+        entries = [*sample_log_entries, perf_entry]
+
+        result = aggregate_log_stream(
+            (entry for entry in entries),
+            date(2025, 12, 1),
+            date(2025, 12, 7),
+        )
+
+        assert result.executive_summary.total_interactions == 1
+        assert result.cost_breakdown.total_cost_usd == Decimal("0.0111")
+        assert result.system_health.total_requests == 4
+        assert result.system_health.warning_messages == ["Warning: something happened"]
@@ -2,6 +2,8 @@
 
 # pylint: disable=protected-access
 
+import base64
+import smtplib
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from pathlib import Path
@@ -176,6 +178,28 @@ class TestEmailSenderMessageCreation:
         disposition = pdf_parts[0]["Content-Disposition"]
         assert "test_report.pdf" in disposition
 
+    def test_pdf_attachment_round_trips(
+        self,
+        mock_config: AppConfig,
+        tmp_path: Path,
+    ) -> None:
+        """Test a multi-chunk PDF decodes back to the original bytes."""
+        pdf_bytes = bytes(range(256)) * 1000
+        pdf_path = tmp_path / "large.pdf"
+        pdf_path.write_bytes(pdf_bytes)
+        sender = EmailSender(mock_config)
+
+        message = sender._create_message(
+            subject="Test",
+            html_body="<html></html>",
+            pdf_path=pdf_path,
+        )
+
+        pdf_part = message.get_payload()[1]
+        assert pdf_part["Content-Transfer-Encoding"] == "base64"
+        assert pdf_part.get_payload(decode=True) == pdf_bytes
+        assert pdf_part.get_payload() == base64.encodebytes(pdf_bytes).decode("ascii")
+
 
 class TestEmailSenderSmtp:
     """Tests for SMTP sending."""
@@ -228,3 +252,49 @@ class TestEmailSenderSmtp:
             call_args = mock_smtp.send_message.call_args
             sent_message = call_args[0][0]
             assert sent_message["Subject"] == "Custom Subject Line"
+
+
+class TestEmailSenderSession:
+    """Tests for reusing one SMTP session across sends."""
+
+    def test_reuses_session_for_multiple_sends(
+        self,
+        mock_config: AppConfig,
+        sample_report_data: ReportData,
+        temp_pdf_file: Path,
+    ) -> None:
+        """Test TLS and login happen once for several reports."""
+        with patch("src.services.email_sender.smtplib.SMTP") as mock_smtp_class:
+            mock_smtp = mock_smtp_class.return_value
+            mock_smtp.noop.return_value = (250, b"OK")
+
+            with EmailSender(mock_config) as sender:
+                for _ in range(3):
+                    sender.send_report(sample_report_data, "<html></html>", temp_pdf_file)
+
+            mock_smtp_class.assert_called_once_with("smtp.example.com", 587)
+            mock_smtp.starttls.assert_called_once()
+            mock_smtp.login.assert_called_once()
+            assert mock_smtp.send_message.call_count == 3
+            mock_smtp.quit.assert_called_once()
+
+    def test_reconnects_when_session_dropped(
+        self,
+        mock_config: AppConfig,
+        sample_report_data: ReportData,
+        temp_pdf_file: Path,
+    ) -> None:
+        """Test a failed NOOP health check opens a fresh session."""
+        with patch("src.services.email_sender.smtplib.SMTP") as mock_smtp_class:
+            stale = MagicMock()
+            stale.noop.side_effect = smtplib.SMTPServerDisconnected()
+            fresh = MagicMock()
+            mock_smtp_class.side_effect = [stale, fresh]
+
+            with EmailSender(mock_config) as sender:
+                sender.send_report(sample_report_data, "<html></html>", temp_pdf_file)
+
+            stale.close.assert_called_once()
+            stale.send_message.assert_not_called()
+            fresh.login.assert_called_once()
+            fresh.send_message.assert_called_once()
@@ -2,15 +2,24 @@
 
 # pylint: disable=protected-access
 
+import json
 from datetime import UTC, datetime
-from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.models.config import AppConfig
 from src.models.log_entry import LogFileEntry, LogFilesPayload
-from src.services.log_fetcher import LogFetcher
+from src.services.log_fetcher import MAX_CONCURRENT_DOWNLOADS, LogFetcher
+
+
+def _streamed(*chunks: str) -> MagicMock:
+    """Build a mock ``client.stream(...)`` context whose response yields chunks."""
+    response = MagicMock()
+    response.iter_text.return_value = iter(chunks)
+    stream = MagicMock()
+    stream.__enter__.return_value = response
+    return stream
 
 
 @pytest.fixture
@@ -81,6 +90,16 @@ class TestLogFetcherContextManager:
             call_kwargs = mock_client_class.call_args[1]
             assert call_kwargs["headers"]["Authorization"] == "Bearer test-token"
 
+    def test_client_uses_http2_with_bounded_pool(self, mock_config: AppConfig) -> None:
+        """Test the client enables HTTP/2 and sizes its pool to the download window."""
+        with (
+            patch("src.services.log_fetcher.httpx.Client") as mock_client_class,
+            LogFetcher(mock_config),
+        ):
+            call_kwargs = mock_client_class.call_args[1]
+            assert call_kwargs["http2"] is True
+            assert call_kwargs["limits"].max_connections == MAX_CONCURRENT_DOWNLOADS
+
 
 class TestLogFetcherRequiresContext:
     """Tests for context manager requirement."""
@@ -110,7 +129,7 @@ class TestLogFetcherApiCalls:
         with patch("src.services.log_fetcher.httpx.Client") as mock_client_class:
             mock_client = MagicMock()
             mock_response = MagicMock()
-            mock_response.json.return_value = log_files_payload.model_dump()
+            mock_response.content = log_files_payload.model_dump_json().encode()
             mock_client.get.return_value = mock_response
             mock_client_class.return_value = mock_client
 
@@ -125,11 +144,13 @@ class TestLogFetcherApiCalls:
         with patch("src.services.log_fetcher.httpx.Client") as mock_client_class:
             mock_client = MagicMock()
             mock_response = MagicMock()
-            mock_response.json.return_value = {
-                "files": [],
-                "total_files": 0,
-                "total_size_bytes": 0,
-            }
+            mock_response.content = json.dumps(
+                {
+                    "files": [],
+                    "total_files": 0,
+                    "total_size_bytes": 0,
+                }
+            ).encode()
             mock_client.get.return_value = mock_response
             mock_client_class.return_value = mock_client
 
@@ -145,15 +166,13 @@ class TestLogFetcherApiCalls:
         """Test download_log_file returns file content."""
         with patch("src.services.log_fetcher.httpx.Client") as mock_client_class:
             mock_client = MagicMock()
-            mock_response = MagicMock()
-            mock_response.text = '{"message": "test log entry"}'
-            mock_client.get.return_value = mock_response
+            mock_client.stream.return_value = _streamed('{"message": ', '"test log entry"}')
             mock_client_class.return_value = mock_client
 
             with LogFetcher(mock_config) as fetcher:
                 content = fetcher.download_log_file("app-2024-01-15.log")
 
-            mock_client.get.assert_called_with("/admin/logs/files/app-2024-01-15.log")
+            mock_client.stream.assert_called_with("GET", "/admin/logs/files/app-2024-01-15.log")
             assert content == '{"message": "test log entry"}'
 
 
@@ -169,41 +188,63 @@ class TestFetchLogsForPeriod:
 
             # Mock list_recent_files response
             list_response = MagicMock()
-            list_response.json.return_value = {
-                "files": [
-                    {
-                        "name": "app-2024-01-15.log",
-                        "size_bytes": 100,
-                        "modified_at": "2024-01-15T12:00:00Z",
-                        "created_at": "2024-01-15T10:00:00Z",
-                    },
-                    {
-                        "name": "app-2024-01-14.log",
-                        "size_bytes": 100,
-                        "modified_at": "2024-01-14T12:00:00Z",
-                        "created_at": "2024-01-14T10:00:00Z",
-                    },
-                    {
-                        "name": "app-2024-01-13.log",
-                        "size_bytes": 100,
-                        "modified_at": "2024-01-13T12:00:00Z",
-                        "created_at": "2024-01-13T10:00:00Z",
-                    },
-                ],
-                "total_files": 3,
-                "total_size_bytes": 300,
-            }
-
+            list_response.content = json.dumps(
+                {
+                    "files": [
+                        {
+                            "name": "app-2024-01-15.log",
+                            "size_bytes": 100,
+                            "modified_at": "2024-01-15T12:00:00Z",
+                            "created_at": "2024-01-15T10:00:00Z",
+                        },
+                        {
+                            "name": "app-2024-01-14.log",
+                            "size_bytes": 100,
+                            "modified_at": "2024-01-14T12:00:00Z",
+                            "created_at": "2024-01-14T10:00:00Z",
+                        },
+                        {
+                            "name": "app-2024-01-13.log",
+                            "size_bytes": 100,
+                            "modified_at": "2024-01-13T12:00:00Z",
+                            "created_at": "2024-01-13T10:00:00Z",
+                        },
+                    ],
+                    "total_files": 3,
+                    "total_size_bytes": 300,
+                }
+            ).encode()
+
+            mock_client.get.return_value = list_response
             # Mock download responses
-            download_response = MagicMock()
-            download_response.text = '{"message": "log"}'
+            mock_client.stream.side_effect = lambda *_args: _streamed('{"message": "log"}')
+            mock_client_class.return_value = mock_client
+
+            with LogFetcher(mock_config) as fetcher:
+                content = fetcher.fetch_logs_for_period(
+                    start_date=date(2024, 1, 14),
+                    end_date=date(2024, 1, 15),
+                )
+
+            # Should download 2 files (14th and 15th)
+            assert mock_client.stream.call_count == 2
+            assert '{"message": "log"}' in content
+
+    def test_joins_downloads_in_listing_order(
+        self,
+        mock_config: AppConfig,
+        log_files_payload: LogFilesPayload,
+    ) -> None:
+        """Test concurrent downloads are concatenated in listing order."""
+        from datetime import date
 
-            def get_side_effect(url: str, **_kwargs: Any) -> MagicMock:
-                if url == "/admin/logs/recent":
-                    return list_response
-                return download_response
+        with patch("src.services.log_fetcher.httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            list_response = MagicMock()
+            list_response.content = log_files_payload.model_dump_json().encode()
 
-            mock_client.get.side_effect = get_side_effect
+            mock_client.get.return_value = list_response
+            mock_client.stream.side_effect = lambda _method, url: _streamed(url.rsplit("/", 1)[-1])
             mock_client_class.return_value = mock_client
 
             with LogFetcher(mock_config) as fetcher:
@@ -212,9 +253,62 @@ class TestFetchLogsForPeriod:
                     end_date=date(2024, 1, 15),
                 )
 
-            # Should download 2 files (14th and 15th)
-            download_calls = [
-                c for c in mock_client.get.call_args_list if "/admin/logs/files/" in c[0][0]
+            assert content == "app-2024-01-15.log\napp-2024-01-14.log"
+
+    def test_no_files_in_range_returns_empty(
+        self,
+        mock_config: AppConfig,
+        log_files_payload: LogFilesPayload,
+    ) -> None:
+        """Test nothing is downloaded when no file falls in the range."""
+        from datetime import date
+
+        with patch("src.services.log_fetcher.httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.get.return_value.content = log_files_payload.model_dump_json().encode()
+            mock_client_class.return_value = mock_client
+
+            with LogFetcher(mock_config) as fetcher:
+                content = fetcher.fetch_logs_for_period(
+                    start_date=date(2024, 2, 1),
+                    end_date=date(2024, 2, 2),
+                )
+
+            assert content == ""
+            mock_client.stream.assert_not_called()
+
+    def test_iter_log_lines_streams_each_file(
+        self,
+        mock_config: AppConfig,
+        log_files_payload: LogFilesPayload,
+    ) -> None:
+        """Test lines from every in-range file are yielded in listing order."""
+        from datetime import date
+
+        with patch("src.services.log_fetcher.httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            list_response = MagicMock()
+            list_response.content = log_files_payload.model_dump_json().encode()
+
+            def stream_side_effect(_method: str, url: str) -> MagicMock:
+                name = url.rsplit("/", 1)[-1]
+                return _streamed(f"{name}:1\n", f"{name}:2\n")
+
+            mock_client.get.return_value = list_response
+            mock_client.stream.side_effect = stream_side_effect
+            mock_client_class.return_value = mock_client
+
+            with LogFetcher(mock_config) as fetcher:
+                lines = list(
+                    fetcher.iter_log_lines(
+                        start_date=date(2024, 1, 14),
+                        end_date=date(2024, 1, 15),
+                    )
+                )
+
+            assert lines == [
+                "app-2024-01-15.log:1",
+                "app-2024-01-15.log:2",
+                "app-2024-01-14.log:1",
+                "app-2024-01-14.log:2",
             ]
-            assert len(download_calls) == 2
-            assert '{"message": "log"}' in content
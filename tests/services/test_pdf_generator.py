@@ -2,12 +2,15 @@
 
 # pylint: disable=protected-access
 
+import os
+import shutil
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from jinja2 import FileSystemLoader, ModuleLoader
 
 
 try:
@@ -25,7 +28,7 @@ from src.models.report_data import (
     SystemHealth,
     UsageAnalytics,
 )
-from src.services.pdf_generator import PdfGenerator
+from src.services.pdf_generator import PdfGenerator, _get_environment, _load_stylesheet
 
 
 @pytest.fixture
@@ -86,6 +89,57 @@ class TestPdfGeneratorInit:
         generator = PdfGenerator(template_dir=tmp_path)
         assert generator._template_dir == tmp_path
 
+    def test_shares_environment_per_template_dir(self, tmp_path: Path) -> None:
+        """Test instances for the same directory reuse one Jinja2 environment."""
+        assert PdfGenerator(template_dir=tmp_path)._env is PdfGenerator(template_dir=tmp_path)._env
+        assert PdfGenerator()._env is not PdfGenerator(template_dir=tmp_path)._env
+
+    def test_environment_uses_bytecode_cache(self) -> None:
+        """Test compiled templates are cached on disk across processes."""
+        assert PdfGenerator()._env.bytecode_cache is not None
+
+
+class TestPdfGeneratorPrecompile:
+    """Tests for ahead-of-time template compilation."""
+
+    def test_precompiled_archive_is_loaded(
+        self,
+        tmp_path: Path,
+        sample_report_data: ReportData,
+    ) -> None:
+        """Test a precompiled archive renders the same HTML as the sources."""
+        template_dir = tmp_path / "templates"
+        shutil.copytree(PdfGenerator()._template_dir, template_dir)
+        expected = PdfGenerator(template_dir=template_dir)._render_html(sample_report_data)
+
+        archive = PdfGenerator(template_dir=template_dir).precompile_templates()
+        _get_environment.cache_clear()
+        generator = PdfGenerator(template_dir=template_dir)
+
+        assert archive.is_file()
+        assert isinstance(generator._env.loader, ModuleLoader)
+        assert generator._render_html(sample_report_data) == expected
+
+    def test_template_syntax_error_raises_runtime_error(self, tmp_path: Path) -> None:
+        """Test a broken template is reported as a RuntimeError."""
+        (tmp_path / "broken.html.jinja").write_text("{% if %}")
+
+        with pytest.raises(RuntimeError, match="Failed to compile templates"):
+            PdfGenerator(template_dir=tmp_path).precompile_templates()
+
+    def test_stale_archive_falls_back_to_sources(self, tmp_path: Path) -> None:
+        """Test templates edited after precompiling are loaded from source."""
+        template_dir = tmp_path / "templates"
+        shutil.copytree(PdfGenerator()._template_dir, template_dir)
+        archive = PdfGenerator(template_dir=template_dir).precompile_templates()
+
+        source = template_dir / "report.html.jinja"
+        built_ns = archive.stat().st_mtime_ns
+        os.utime(source, ns=(built_ns, built_ns + 1_000_000_000))
+        _get_environment.cache_clear()
+
+        assert isinstance(PdfGenerator(template_dir=template_dir)._env.loader, FileSystemLoader)
+
 
 class TestPdfGeneratorHtmlRendering:
     """Tests for HTML rendering."""
@@ -115,6 +169,27 @@ class TestPdfGeneratorHtmlRendering:
         assert "<style>" in html
         assert "font-family:" in html
 
+    def test_body_rendered_once_for_pdf_and_email(
+        self,
+        sample_report_data: ReportData,
+    ) -> None:
+        """Test the PDF and email documents share one body render."""
+        generator = PdfGenerator()
+        with patch.object(
+            generator._env, "get_template", wraps=generator._env.get_template
+        ) as mock_get_template:
+            pdf_html = generator._render_html(sample_report_data)
+            email_html = generator.render_html_for_email(sample_report_data)
+
+        body_loads = [
+            c for c in mock_get_template.call_args_list if c[0][0] == "report_body.html.jinja"
+        ]
+        assert len(body_loads) == 1
+        assert pdf_html.endswith("</body>\n</html>\n")
+        assert '<link rel="stylesheet" href="report.css">' in pdf_html
+        assert "<style>" not in pdf_html
+        assert pdf_html.split("<body>")[1] == email_html.split("<body>")[1]
+
     def test_renders_performance_metrics(
         self,
         sample_report_data: ReportData,
@@ -210,3 +285,21 @@ class TestPdfGeneratorPdfCreation:
             result = generator.generate(sample_report_data, output_path)
 
             assert result == output_path
+
+    def test_stylesheet_parsed_once_across_reports(
+        self,
+        tmp_path: Path,
+        sample_report_data: ReportData,
+    ) -> None:
+        """Test report.css is parsed once and reused for later PDFs."""
+        _load_stylesheet.cache_clear()
+        generator = PdfGenerator()
+
+        with patch("weasyprint.HTML") as mock_html_class, patch("weasyprint.CSS") as mock_css:
+            generator.generate(sample_report_data, tmp_path / "first.pdf")
+            generator.generate(sample_report_data, tmp_path / "second.pdf")
+
+            mock_css.assert_called_once()
+            stylesheets = mock_html_class.return_value.write_pdf.call_args[1]["stylesheets"]
+            assert stylesheets == [mock_css.return_value]
+        _load_stylesheet.cache_clear()
@@ -2,14 +2,17 @@
 
 # pylint: disable=protected-access
 
+import threading
+from collections.abc import Iterator
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
-from src.models.config import AppConfig, ReportPeriod
+from src.models.config import ApiConfig, AppConfig, ReportPeriod
 from src.models.report_data import (
     CostBreakdown,
     ExecutiveSummary,
@@ -18,12 +21,13 @@ from src.models.report_data import (
     SystemHealth,
     UsageAnalytics,
 )
-from src.services.report_generator import ReportGenerator
+from src.services.pdf_generator import PdfGenerator
+from src.services.report_generator import ReportGenerator, ReportResult
 
 
-@pytest.fixture
-def mock_config() -> AppConfig:
-    """Create mock configuration."""
+@pytest.fixture(scope="session")
+def base_config() -> AppConfig:
+    """Create the shared configuration, validated once per session."""
     return AppConfig(
         bt_servant_api_url="https://api.example.com",
         bt_servant_api_token="test-token",
@@ -37,8 +41,14 @@ def mock_config() -> AppConfig:
 
 
 @pytest.fixture
+def mock_config(base_config: AppConfig) -> AppConfig:
+    """Return a per-test copy of the shared configuration that tests may modify."""
+    return base_config.model_copy()
+
+
+@pytest.fixture(scope="session")
 def sample_report_data() -> ReportData:
-    """Create sample report data."""
+    """Create sample report data, shared read-only across the session."""
     return ReportData(
         generated_at=datetime(2024, 1, 16, 10, 0, 0, tzinfo=UTC),
         executive_summary=ExecutiveSummary(
@@ -80,6 +90,31 @@ def sample_report_data() -> ReportData:
     )
 
 
+@pytest.fixture
+def patched_pipeline(
+    mock_config: AppConfig,
+    sample_report_data: ReportData,
+    tmp_path: Path,
+) -> Iterator[dict[str, MagicMock]]:
+    """Patch every pipeline step of ReportGenerator with canned results."""
+    mock_config.report_output_dir = tmp_path
+
+    with (
+        patch.object(PdfGenerator, "warm_up"),
+        patch.multiple(
+            ReportGenerator,
+            fetch_logs=DEFAULT,
+            process_logs=DEFAULT,
+            _generate_pdf=DEFAULT,
+            _send_email=DEFAULT,
+        ) as mocks,
+    ):
+        mocks["fetch_logs"].return_value = iter(["log content"])
+        mocks["process_logs"].return_value = sample_report_data
+        mocks["_generate_pdf"].return_value = tmp_path / "report.pdf"
+        yield mocks
+
+
 class TestReportGeneratorDateResolution:
     """Tests for date resolution logic."""
 
@@ -115,11 +150,23 @@ class TestReportGeneratorDateResolution:
         assert start_date == date(2024, 1, 1)
         assert (end_date - start_date).days == 29
 
+    def test_default_end_date_relative_to_given_now(self, mock_config: AppConfig) -> None:
+        """Test a captured reference time drives the default range."""
+        mock_config.report_period = ReportPeriod.WEEKLY
+        generator = ReportGenerator(mock_config)
+
+        start, end = generator.resolve_dates(
+            None, None, now=datetime(2024, 1, 16, 0, 0, 1, tzinfo=UTC)
+        )
+
+        assert end == date(2024, 1, 15)
+        assert start == date(2024, 1, 9)
+
     def test_explicit_dates_override_period(self, mock_config: AppConfig) -> None:
         """Test explicit dates override configured period."""
         generator = ReportGenerator(mock_config)
 
-        start, end = generator._resolve_dates(
+        start, end = generator.resolve_dates(
             start_date=date(2024, 1, 1),
             end_date=date(2024, 1, 31),
         )
@@ -131,76 +178,156 @@ class TestReportGeneratorDateResolution:
         """Test default end date is yesterday."""
         generator = ReportGenerator(mock_config)
 
-        with patch("src.services.report_generator.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 16, 12, 0, tzinfo=UTC)
-            mock_datetime.side_effect = datetime
-
-            _, end = generator._resolve_dates(None, None)
+        _, end = generator.resolve_dates(None, None, now=datetime(2024, 1, 16, 12, 0, tzinfo=UTC))
 
-            assert end == date(2024, 1, 15)
+        assert end == date(2024, 1, 15)
 
 
 class TestReportGeneratorPipeline:
     """Tests for full pipeline execution."""
 
-    def test_generate_and_send_full_pipeline(
+    @pytest.mark.parametrize("send_email", [True, False])
+    def test_generate_and_send_pipeline(
+        self,
+        patched_pipeline: dict[str, MagicMock],
+        mock_config: AppConfig,
+        tmp_path: Path,
+        send_email: bool,
+    ) -> None:
+        """Test pipeline runs every step, sending email only when asked."""
+        generator = ReportGenerator(mock_config, send_email=send_email)
+        result = generator.generate_and_send(
+            start_date=date(2024, 1, 15),
+            end_date=date(2024, 1, 15),
+        )
+
+        patched_pipeline["fetch_logs"].assert_called_once()
+        patched_pipeline["process_logs"].assert_called_once()
+        patched_pipeline["_generate_pdf"].assert_called_once()
+        assert patched_pipeline["_send_email"].called == send_email
+        assert result.pdf_path == tmp_path / "report.pdf"
+        assert result.email_sent == send_email
+        assert result.emailed_to == (("recipient@example.com",) if send_email else ())
+
+    def test_warms_up_pdf_backend_during_fetch(
         self,
         mock_config: AppConfig,
         sample_report_data: ReportData,
         tmp_path: Path,
     ) -> None:
-        """Test full pipeline executes all steps."""
+        """Test WeasyPrint is warmed up alongside the log fetch, before the PDF."""
         mock_config.report_output_dir = tmp_path
+        calls: list[str] = []
 
         with (
             patch.object(ReportGenerator, "fetch_logs") as mock_fetch,
-            patch.object(ReportGenerator, "process_logs") as mock_process,
+            patch.object(ReportGenerator, "process_logs", return_value=sample_report_data),
             patch.object(ReportGenerator, "_generate_pdf") as mock_pdf,
-            patch.object(ReportGenerator, "_send_email") as mock_email,
         ):
-            mock_fetch.return_value = "log content"
-            mock_process.return_value = sample_report_data
-            mock_pdf.return_value = tmp_path / "report.pdf"
+            mock_fetch.side_effect = lambda *_args: calls.append("fetch")
+            mock_pdf.side_effect = lambda *_args: calls.append("pdf")
+            generator = ReportGenerator(mock_config, send_email=False)
+            with patch.object(
+                generator._pdf_generator, "warm_up", side_effect=lambda: calls.append("warm")
+            ):
+                generator.generate_and_send(date(2024, 1, 15), date(2024, 1, 15))
+
+        assert sorted(calls[:2]) == ["fetch", "warm"]
+        assert calls[2:] == ["pdf"]
+
+    def test_fetch_failure_does_not_wait_for_warm_up(
+        self,
+        mock_config: AppConfig,
+        tmp_path: Path,
+    ) -> None:
+        """Test a failed fetch is raised while the warm-up is still running."""
+        mock_config.report_output_dir = tmp_path
+        release = threading.Event()
+        warmed_up = threading.Event()
 
-            generator = ReportGenerator(mock_config)
-            result = generator.generate_and_send(
-                start_date=date(2024, 1, 15),
-                end_date=date(2024, 1, 15),
-            )
+        def slow_warm_up() -> None:
+            release.wait(5)
+            warmed_up.set()
 
-            mock_fetch.assert_called_once()
-            mock_process.assert_called_once()
-            mock_pdf.assert_called_once()
-            mock_email.assert_called_once()
-            assert result == tmp_path / "report.pdf"
+        generator = ReportGenerator(mock_config, send_email=False)
+        with (
+            patch.object(generator._pdf_generator, "warm_up", side_effect=slow_warm_up),
+            patch.object(ReportGenerator, "fetch_logs", side_effect=ValueError("no logs")),
+            patch.object(ReportGenerator, "_generate_pdf") as mock_pdf,
+            pytest.raises(ValueError, match="no logs"),
+        ):
+            generator.generate_and_send(date(2024, 1, 15), date(2024, 1, 15))
 
-    def test_generate_without_email(
+        assert not warmed_up.is_set()
+        release.set()
+        mock_pdf.assert_not_called()
+
+    def test_email_html_rendered_alongside_pdf(
         self,
         mock_config: AppConfig,
         sample_report_data: ReportData,
         tmp_path: Path,
     ) -> None:
-        """Test pipeline can skip email sending."""
+        """Test the email HTML rendered during PDF generation is what gets sent."""
         mock_config.report_output_dir = tmp_path
 
         with (
-            patch.object(ReportGenerator, "fetch_logs") as mock_fetch,
-            patch.object(ReportGenerator, "process_logs") as mock_process,
-            patch.object(ReportGenerator, "_generate_pdf") as mock_pdf,
+            patch.object(PdfGenerator, "warm_up"),
+            patch.object(ReportGenerator, "fetch_logs"),
+            patch.object(ReportGenerator, "process_logs", return_value=sample_report_data),
+            patch.object(ReportGenerator, "_generate_pdf", return_value=tmp_path / "r.pdf"),
             patch.object(ReportGenerator, "_send_email") as mock_email,
         ):
-            mock_fetch.return_value = "log content"
-            mock_process.return_value = sample_report_data
-            mock_pdf.return_value = tmp_path / "report.pdf"
-
             generator = ReportGenerator(mock_config)
-            generator.generate_and_send(
-                start_date=date(2024, 1, 15),
-                end_date=date(2024, 1, 15),
-                send_email=False,
-            )
+            with patch.object(
+                generator._pdf_generator, "render_html_for_email", return_value="<html/>"
+            ):
+                generator.generate_and_send(date(2024, 1, 15), date(2024, 1, 15))
+
+            mock_email.assert_called_once_with(sample_report_data, tmp_path / "r.pdf", "<html/>")
+
+
+class TestReportGeneratorWithoutEmailConfig:
+    """Tests for running with API-only configuration."""
+
+    def test_send_email_requires_email_config(self) -> None:
+        """Test email without SMTP settings is rejected before any work is done."""
+        config = ApiConfig(
+            bt_servant_api_url="https://api.example.com",
+            bt_servant_api_token="test-token",
+        )
+
+        with (
+            patch.object(ReportGenerator, "fetch_logs") as mock_fetch,
+            pytest.raises(RuntimeError, match="Email settings are not configured"),
+        ):
+            ReportGenerator(config)
+
+        mock_fetch.assert_not_called()
+
+    def test_api_config_is_enough_without_email(
+        self,
+        sample_report_data: ReportData,
+        tmp_path: Path,
+    ) -> None:
+        """Test an API-only config can generate a report when email is disabled."""
+        config = ApiConfig(
+            bt_servant_api_url="https://api.example.com",
+            bt_servant_api_token="test-token",
+            report_output_dir=tmp_path,
+        )
+
+        with (
+            patch.object(ReportGenerator, "fetch_logs"),
+            patch.object(ReportGenerator, "process_logs", return_value=sample_report_data),
+            patch.object(ReportGenerator, "_generate_pdf", return_value=tmp_path / "r.pdf"),
+        ):
+            generator = ReportGenerator(config, send_email=False)
+            with patch.object(generator._pdf_generator, "warm_up"):
+                result = generator.generate_and_send(date(2024, 1, 15), date(2024, 1, 15))
 
-            mock_email.assert_not_called()
+        assert result == ReportResult(tmp_path / "r.pdf")
+        assert not result.email_sent
 
 
 class TestReportGeneratorLogFetching:
@@ -213,18 +340,19 @@ class TestReportGeneratorLogFetching:
         """Test logs are fetched for correct date range."""
         with patch("src.services.report_generator.LogFetcher") as mock_fetcher_class:
             mock_fetcher = MagicMock()
-            mock_fetcher.fetch_logs_for_period.return_value = "log content"
+            mock_fetcher.iter_log_lines.return_value = iter(["line 1", "line 2"])
             mock_fetcher_class.return_value.__enter__ = MagicMock(return_value=mock_fetcher)
             mock_fetcher_class.return_value.__exit__ = MagicMock(return_value=False)
 
             generator = ReportGenerator(mock_config)
-            content = generator.fetch_logs(date(2024, 1, 15), date(2024, 1, 15))
+            lines = list(generator.fetch_logs(date(2024, 1, 15), date(2024, 1, 15)))
 
-            mock_fetcher.fetch_logs_for_period.assert_called_once_with(
+            mock_fetcher.iter_log_lines.assert_called_once_with(
                 date(2024, 1, 15),
                 date(2024, 1, 15),
             )
-            assert content == "log content"
+            assert lines == ["line 1", "line 2"]
+            mock_fetcher_class.return_value.__exit__.assert_called_once()
 
 
 class TestReportGeneratorLogProcessing:
@@ -238,16 +366,12 @@ class TestReportGeneratorLogProcessing:
         """Test logs are processed into ReportData."""
         with (
             patch("src.services.report_generator.parse_log_lines") as mock_parse,
-            patch("src.services.report_generator.extract_perf_reports") as mock_extract,
-            patch("src.services.report_generator.aggregate_metrics") as mock_aggregate,
+            patch("src.services.report_generator.aggregate_log_stream") as mock_aggregate,
         ):
             log_content = "irrelevant"
-            in_range = MagicMock()
-            in_range.timestamp = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
-            out_of_range = MagicMock()
-            out_of_range.timestamp = datetime(2024, 2, 1, 12, 0, 0, tzinfo=UTC)
+            in_range = SimpleNamespace(timestamp=datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC))
+            out_of_range = SimpleNamespace(timestamp=datetime(2024, 2, 1, 12, 0, 0, tzinfo=UTC))
             mock_parse.return_value = iter([in_range, out_of_range])
-            mock_extract.return_value = []
             mock_aggregate.return_value = sample_report_data
 
             generator = ReportGenerator(mock_config)
@@ -259,8 +383,8 @@ class TestReportGeneratorLogProcessing:
 
             assert result == sample_report_data
             mock_aggregate.assert_called_once()
-            filtered_entries = mock_aggregate.call_args[0][1]
-            assert filtered_entries == [in_range]
+            filtered_entries = mock_aggregate.call_args[0][0]
+            assert list(filtered_entries) == [in_range]
 
 
 class TestReportGeneratorPdfGeneration: